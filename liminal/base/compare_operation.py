@@ -1,13 +1,12 @@
-from pydantic import BaseModel, ConfigDict
+from dataclasses import dataclass
 
 from liminal.base.base_operation import BaseOperation
 
 
-class CompareOperation(BaseModel):
+@dataclass(frozen=True, slots=True)
+class CompareOperation:
     op: BaseOperation
     reverse_op: BaseOperation
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-
     def __lt__(self, other: "CompareOperation") -> bool:
         return self.op.order < other.op.order
@@ -79,6 +79,13 @@ class BaseFieldProperties(BaseModel):
             self.__pydantic_fields_set__.remove("unit_name")
         return self
 
+    def unset_deferred(self) -> BaseFieldProperties:
+        """Unsets the tooltip, entity_link, and unit_name, which cannot be set when creating a field and are updated afterwards."""
+        self.__pydantic_fields_set__.difference_update(
+            ("tooltip", "entity_link", "unit_name")
+        )
+        return self
+
     def set_type(self, new_type: BenchlingFieldType) -> BaseFieldProperties:
         self.type = new_type
         return self
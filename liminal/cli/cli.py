@@ -1,4 +1,5 @@
 #!/usr/bin/env python
+import os
 from pathlib import Path
 from typing import Any
 import typer
@@ -19,6 +20,7 @@ from liminal.cli.utils import read_local_liminal_dir
 from liminal.connection.benchling_service import (
     BenchlingService,
 )
+from liminal.dropdowns.utils import LIMINAL_NO_CACHE_ENV_VAR
 from liminal.migrate.revisions_timeline import RevisionsTimeline
 
 
@@ -40,6 +42,18 @@ ENV_FILE_PATH = LIMINAL_DIR_PATH / "env.py"
 VERSIONS_DIR_PATH = LIMINAL_DIR_PATH / "versions"
 
 
+@app.callback()
+def main(
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help=f"Do not read or write the on-disk cache of Benchling data. Equivalent to setting the {LIMINAL_NO_CACHE_ENV_VAR} environment variable.",
+    ),
+) -> None:
+    if no_cache:
+        os.environ[LIMINAL_NO_CACHE_ENV_VAR] = "1"
+
+
 @app.command(
     name="init",
     help="Initializes the working directory to use the Liminal CLI. If liminal/ doesn't exist, a new liminal/versions directory is created with an empty initial revision file and a liminal/env.py file.",
@@ -6,6 +6,7 @@ from benchling_sdk.auth.client_credentials_oauth2 import ClientCredentialsOAuth2
 from benchling_sdk.benchling import Benchling
 from benchling_sdk.helpers.retry_helpers import RetryStrategy
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, configure_mappers
@@ -15,6 +16,7 @@ from tenacity import (
     stop_after_attempt,
     wait_exponential,
 )
+from urllib3.util.retry import Retry
 
 from liminal.base.properties.base_field_properties import BaseFieldProperties
 from liminal.base.properties.base_schema_properties import BaseSchemaProperties
@@ -30,6 +32,7 @@ logging.getLogger("httpx").setLevel(logging.WARNING)
 
 REMOTE_LIMINAL_SCHEMA_NAME = "liminal_remote"
 REMOTE_REVISION_ID_FIELD_WH_NAME = "revision_id"
+INTERNAL_API_TIMEOUT = 30
 
 
 class BenchlingService(Benchling):
@@ -60,6 +63,15 @@ class BenchlingService(Benchling):
         self._session: Session | None = None
         self.use_api = use_api
         self.benchling_tenant = connection.tenant_name
+        self.http_session = self._create_http_session()
+        # Dropdown summaries and dropdowns written during a migration. Managed by liminal.dropdowns.utils.
+        self._dropdown_summaries: list[Any] | None = None
+        self._dropdown_summaries_by_name: dict[str, Any] | None = None
+        self._dropdown_cache: dict[str, Any] = {}
+        # Raw tag schemas fetched from the internal API. Managed by liminal.entity_schemas.tag_schema_models.
+        self._tag_schemas_json: list[dict[str, Any]] | None = None
+        # Tag schemas converted to internal properties, keyed by arguments. Managed by liminal.entity_schemas.utils.
+        self._converted_tag_schemas: dict[Any, list[Any]] = {}
         if use_api:
             retry_strategy = RetryStrategy(max_tries=10)
             auth_method = ClientCredentialsOAuth2(
@@ -125,6 +137,25 @@ class BenchlingService(Benchling):
         assert len(registries) == 1
         return registries[0].id
 
+    @staticmethod
+    def _create_http_session() -> requests.Session:
+        """Creates a requests session with a pooled adapter that retries on rate limits and server errors.
+        Once the retries are exhausted the last response is returned instead of raising, so callers can surface Benchling's error.
+        This session is reused across internal API calls so that connections to the tenant are kept alive."""
+        http_session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=(429, 500, 502, 503, 504),
+                raise_on_status=False,
+            ),
+        )
+        http_session.mount("https://", adapter)
+        return http_session
+
     def __enter__(self) -> Session:
         self._session = self.get_session()
         return self._session
@@ -2,11 +2,15 @@ import json
 import logging
 from typing import Any
 
-import requests
 from benchling_sdk.models import Dropdown, DropdownCreate, DropdownOption
 from rich import print
 
-from liminal.connection.benchling_service import BenchlingService
+from liminal.connection.benchling_service import (
+    INTERNAL_API_TIMEOUT,
+    BenchlingService,
+)
+from liminal.dropdowns.utils import invalidate_benchling_dropdown_summaries
+from liminal.entity_schemas.utils import invalidate_converted_tag_schemas
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +22,8 @@ def create_dropdown(
     Create a new dropdown.
     """
     dropdown = benchling_service.dropdowns.create(dropdown=new_dropdown)
+    invalidate_benchling_dropdown_summaries(benchling_service)
+    invalidate_converted_tag_schemas(benchling_service)
     return {dropdown.id: dropdown}
 
 
@@ -27,16 +33,18 @@ def update_dropdown_name(
     """
     Update the name of a dropdown.
     """
-    with requests.Session() as session:
-        response = session.patch(
-            f"https://{benchling_service.benchling_tenant}.benchling.com/1/api/schema-field-selectors/{dropdown_id}",
-            data=json.dumps({"name": new_name}),
-            headers=benchling_service.custom_post_headers,
-            cookies=benchling_service.custom_post_cookies,
-        )
-        if not response.ok:
-            raise Exception(f"Failed to update dropdown name: {response.json()}")
-        return response.json()
+    response = benchling_service.http_session.patch(
+        f"https://{benchling_service.benchling_tenant}.benchling.com/1/api/schema-field-selectors/{dropdown_id}",
+        data=json.dumps({"name": new_name}, separators=(",", ":")),
+        headers=benchling_service.custom_post_headers,
+        cookies=benchling_service.custom_post_cookies,
+        timeout=INTERNAL_API_TIMEOUT,
+    )
+    if not response.ok:
+        raise Exception(f"Failed to update dropdown name: {response.json()}")
+    invalidate_benchling_dropdown_summaries(benchling_service)
+    invalidate_converted_tag_schemas(benchling_service)
+    return response.json()
 
 
 def archive_dropdown(
@@ -45,16 +53,20 @@ def archive_dropdown(
     """
     Archive a dropdown.
     """
-    with requests.Session() as session:
-        response = session.post(
-            f"https://{benchling_service.benchling_tenant}.benchling.com/1/api/schema-field-selectors:bulk-archive",
-            data=json.dumps({"ids": [dropdown_id], "purpose": "Made in error"}),
-            headers=benchling_service.custom_post_headers,
-            cookies=benchling_service.custom_post_cookies,
-        )
-        if not response.ok:
-            raise Exception(f"Failed to archive dropdown: {response.json()}")
-        return response.json()
+    response = benchling_service.http_session.post(
+        f"https://{benchling_service.benchling_tenant}.benchling.com/1/api/schema-field-selectors:bulk-archive",
+        data=json.dumps(
+            {"ids": [dropdown_id], "purpose": "Made in error"}, separators=(",", ":")
+        ),
+        headers=benchling_service.custom_post_headers,
+        cookies=benchling_service.custom_post_cookies,
+        timeout=INTERNAL_API_TIMEOUT,
+    )
+    if not response.ok:
+        raise Exception(f"Failed to archive dropdown: {response.json()}")
+    invalidate_benchling_dropdown_summaries(benchling_service)
+    invalidate_converted_tag_schemas(benchling_service)
+    return response.json()
 
 
 def unarchive_dropdown(
@@ -63,16 +75,18 @@ def unarchive_dropdown(
     """
     Unarchive a dropdown.
     """
-    with requests.Session() as session:
-        response = session.post(
-            f"https://{benchling_service.benchling_tenant}.benchling.com/1/api/schema-field-selectors:bulk-unarchive",
-            data=json.dumps({"ids": [dropdown_id]}),
-            headers=benchling_service.custom_post_headers,
-            cookies=benchling_service.custom_post_cookies,
-        )
-        if not response.ok:
-            raise Exception(f"Failed to unarchive dropdown: {response.json()}")
-        return response.json()
+    response = benchling_service.http_session.post(
+        f"https://{benchling_service.benchling_tenant}.benchling.com/1/api/schema-field-selectors:bulk-unarchive",
+        data=json.dumps({"ids": [dropdown_id]}, separators=(",", ":")),
+        headers=benchling_service.custom_post_headers,
+        cookies=benchling_service.custom_post_cookies,
+        timeout=INTERNAL_API_TIMEOUT,
+    )
+    if not response.ok:
+        raise Exception(f"Failed to unarchive dropdown: {response.json()}")
+    invalidate_benchling_dropdown_summaries(benchling_service)
+    invalidate_converted_tag_schemas(benchling_service)
+    return response.json()
 
 
 def update_dropdown_options(
@@ -81,18 +95,19 @@ def update_dropdown_options(
     """
     Update the options of a dropdown.
     """
-    with requests.Session() as session:
-        response = session.patch(
-            f"https://{benchling_service.benchling_tenant}.benchling.com/1/api/schema-field-selectors/{dropdown_id}",
-            data=json.dumps(
-                {"schemaFieldSelectorOptions": [o.to_dict() for o in options]}
-            ),
-            headers=benchling_service.custom_post_headers,
-            cookies=benchling_service.custom_post_cookies,
-        )
-        if not response.ok:
-            raise Exception(response.json())
-        return response.json()
+    response = benchling_service.http_session.patch(
+        f"https://{benchling_service.benchling_tenant}.benchling.com/1/api/schema-field-selectors/{dropdown_id}",
+        data=json.dumps(
+            {"schemaFieldSelectorOptions": [o.to_dict() for o in options]},
+            separators=(",", ":"),
+        ),
+        headers=benchling_service.custom_post_headers,
+        cookies=benchling_service.custom_post_cookies,
+        timeout=INTERNAL_API_TIMEOUT,
+    )
+    if not response.ok:
+        raise Exception(response.json())
+    return response.json()
 
 
 def resubmit_archive_dropdown_option(
@@ -118,18 +133,19 @@ def resubmit_archive_dropdown_option(
         )
     if checkpoint == "q":
         raise ValueError("User requested rollback.")
-    with requests.Session() as session:
-        resubmitted_response = session.patch(
-            f"https://{benchling_service.benchling_tenant}.benchling.com/1/api/schema-field-selectors/{dropdown_id}",
-            data=json.dumps(
-                {
-                    "schemaFieldSelectorOptions": [o.to_dict() for o in options],
-                    "selectorOptionToUpdate": selector_option_to_update,
-                }
-            ),
-            headers=benchling_service.custom_post_headers,
-            cookies=benchling_service.custom_post_cookies,
-        )
+    resubmitted_response = benchling_service.http_session.patch(
+        f"https://{benchling_service.benchling_tenant}.benchling.com/1/api/schema-field-selectors/{dropdown_id}",
+        data=json.dumps(
+            {
+                "schemaFieldSelectorOptions": [o.to_dict() for o in options],
+                "selectorOptionToUpdate": selector_option_to_update,
+            },
+            separators=(",", ":"),
+        ),
+        headers=benchling_service.custom_post_headers,
+        cookies=benchling_service.custom_post_cookies,
+        timeout=INTERNAL_API_TIMEOUT,
+    )
     if not resubmitted_response.ok:
         raise Exception(resubmitted_response.json())
     return resubmitted_response.json()
@@ -158,18 +174,19 @@ def resubmit_update_dropdown_option(
         )
     if checkpoint == "q":
         raise ValueError("User requested rollback.")
-    with requests.Session() as session:
-        resubmitted_response = session.patch(
-            f"https://{benchling_service.benchling_tenant}.benchling.com/1/api/schema-field-selectors/{dropdown_id}",
-            data=json.dumps(
-                {
-                    "schemaFieldSelectorOptions": [o.to_dict() for o in options],
-                    "selectorOptionToUpdate": selector_option_to_update,
-                }
-            ),
-            headers=benchling_service.custom_post_headers,
-            cookies=benchling_service.custom_post_cookies,
-        )
+    resubmitted_response = benchling_service.http_session.patch(
+        f"https://{benchling_service.benchling_tenant}.benchling.com/1/api/schema-field-selectors/{dropdown_id}",
+        data=json.dumps(
+            {
+                "schemaFieldSelectorOptions": [o.to_dict() for o in options],
+                "selectorOptionToUpdate": selector_option_to_update,
+            },
+            separators=(",", ":"),
+        ),
+        headers=benchling_service.custom_post_headers,
+        cookies=benchling_service.custom_post_cookies,
+        timeout=INTERNAL_API_TIMEOUT,
+    )
     if not resubmitted_response.ok:
         raise Exception(resubmitted_response.json())
     return resubmitted_response.json()
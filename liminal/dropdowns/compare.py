@@ -1,7 +1,5 @@
 import logging
 
-from benchling_sdk.models import Dropdown
-
 from liminal.base.base_dropdown import BaseDropdown
 from liminal.base.compare_operation import CompareOperation
 from liminal.connection import BenchlingService
@@ -13,7 +11,7 @@ from liminal.dropdowns.operations import (
     ReorderDropdownOptions,
     UnarchiveDropdown,
 )
-from liminal.dropdowns.utils import get_benchling_dropdowns_dict
+from liminal.dropdowns.utils import DropdownData, get_benchling_dropdowns_dict
 
 LOGGER = logging.getLogger(__name__)
 
@@ -22,7 +20,7 @@ def compare_dropdowns(
     benchling_service: BenchlingService, dropdown_names: set[str] | None = None
 ) -> dict[str, list[CompareOperation]]:
     dropdown_operations: dict[str, list[CompareOperation]] = {}
-    benchling_dropdowns: dict[str, Dropdown] = get_benchling_dropdowns_dict(
+    benchling_dropdowns: dict[str, DropdownData] = get_benchling_dropdowns_dict(
         benchling_service, include_archived=True
     )
     processed_benchling_names = set()
@@ -36,129 +34,113 @@ def compare_dropdowns(
             name: benchling_dropdowns[name]
             for name in [d.__benchling_name__ for d in model_dropdowns]
         }
-    archived_benchling_dropdown_names = [
-        d
-        for d in benchling_dropdowns.keys()
-        if benchling_dropdowns[d].archive_record is not None
-    ]
-    active_benchling_dropdown_names = [
-        d
-        for d in benchling_dropdowns.keys()
-        if benchling_dropdowns[d].archive_record is None
-    ]
-    dropdowns_to_unarchive = []
+    archived_benchling_dropdown_names: set[str] = set()
+    active_benchling_dropdown_names: set[str] = set()
+    for name, benchling_dropdown in benchling_dropdowns.items():
+        if benchling_dropdown.archive_record is not None:
+            archived_benchling_dropdown_names.add(name)
+        else:
+            active_benchling_dropdown_names.add(name)
     for model_dropdown in model_dropdowns:
         ops: list[CompareOperation] = []
-        if model_dropdown.__benchling_name__ in archived_benchling_dropdown_names:
+        dropdown_name = model_dropdown.__benchling_name__
+        allowed_values = model_dropdown.__allowed_values__
+        dropdown_operations[model_dropdown.__name__] = ops
+        processed_benchling_names.add(dropdown_name)
+        is_unarchiving = dropdown_name in archived_benchling_dropdown_names
+        if is_unarchiving:
             ops.append(
                 CompareOperation(
-                    op=UnarchiveDropdown(model_dropdown.__benchling_name__),
-                    reverse_op=ArchiveDropdown(model_dropdown.__benchling_name__),
+                    op=UnarchiveDropdown(dropdown_name),
+                    reverse_op=ArchiveDropdown(dropdown_name),
                 )
             )
-            dropdowns_to_unarchive.append(model_dropdown.__benchling_name__)
-        if (
-            model_dropdown.__benchling_name__ in active_benchling_dropdown_names
-            or model_dropdown.__benchling_name__ in dropdowns_to_unarchive
-        ):
-            if model_dropdown.__benchling_name__ in dropdowns_to_unarchive:
-                benchling_options = [
-                    o.name
-                    for o in benchling_dropdowns[
-                        model_dropdown.__benchling_name__
-                    ].options
-                ]
-            else:
-                benchling_options = [
-                    o.name
-                    for o in benchling_dropdowns[
-                        model_dropdown.__benchling_name__
-                    ].options
-                    if o.archive_record is None
-                ]
-            if (
-                benchling_options != model_dropdown.__allowed_values__
-                or model_dropdown.__benchling_name__ in dropdowns_to_unarchive
-            ):
-                if model_dropdown.__benchling_name__ in dropdowns_to_unarchive:
-                    options_to_create = model_dropdown.__allowed_values__
-                else:
-                    options_to_create = [
-                        o
-                        for o in model_dropdown.__allowed_values__
-                        if o not in benchling_options
-                    ]
-                options_to_archive = set(benchling_options) - set(
-                    model_dropdown.__allowed_values__
+        elif dropdown_name not in active_benchling_dropdown_names:
+            ops.append(
+                CompareOperation(
+                    op=CreateDropdown(
+                        dropdown_name,
+                        allowed_values,
+                    ),
+                    reverse_op=ArchiveDropdown(dropdown_name),
                 )
-                recreated_benchling_options = [
-                    o
-                    for o in benchling_options
-                    if o in model_dropdown.__allowed_values__
-                ]
-                recreated_model_options = [
-                    o
-                    for o in model_dropdown.__allowed_values__
-                    if o in recreated_benchling_options
-                ]
-                for option in options_to_archive:
-                    ops.append(
-                        CompareOperation(
-                            op=ArchiveDropdownOption(
-                                model_dropdown.__benchling_name__,
-                                option,
-                                index=benchling_options.index(option),
-                            ),
-                            reverse_op=CreateDropdownOption(
-                                model_dropdown.__benchling_name__,
-                                option,
-                                index=benchling_options.index(option),
-                            ),
-                        )
-                    )
-                for option in options_to_create:
-                    ops.append(
-                        CompareOperation(
-                            op=CreateDropdownOption(
-                                model_dropdown.__benchling_name__,
-                                option,
-                                index=model_dropdown.__allowed_values__.index(option),
-                            ),
-                            reverse_op=ArchiveDropdownOption(
-                                model_dropdown.__benchling_name__,
-                                option,
-                                index=model_dropdown.__allowed_values__.index(option),
-                            ),
-                        )
-                    )
-                if recreated_benchling_options != recreated_model_options:
-                    ops.append(
-                        CompareOperation(
-                            op=ReorderDropdownOptions(
-                                model_dropdown.__benchling_name__,
-                                model_dropdown.__allowed_values__,
-                            ),
-                            reverse_op=ReorderDropdownOptions(
-                                model_dropdown.__benchling_name__,
-                                recreated_benchling_options,
-                            ),
-                        )
-                    )
+            )
+            continue
+        if is_unarchiving:
+            benchling_options = [
+                o.name for o in benchling_dropdowns[dropdown_name].options
+            ]
+        else:
+            benchling_options = [
+                o.name
+                for o in benchling_dropdowns[dropdown_name].options
+                if o.archive_record is None
+            ]
+            # The active dropdown already matches the code definition, so there is nothing to diff.
+            if benchling_options == allowed_values:
+                continue
+        benchling_options_set = set(benchling_options)
+        allowed_values_set = set(allowed_values)
+        if is_unarchiving:
+            options_to_create = allowed_values
         else:
+            options_to_create = [
+                o for o in allowed_values if o not in benchling_options_set
+            ]
+        options_to_archive = benchling_options_set - allowed_values_set
+        recreated_benchling_options = [
+            o for o in benchling_options if o in allowed_values_set
+        ]
+        recreated_benchling_options_set = set(recreated_benchling_options)
+        recreated_model_options = [
+            o for o in allowed_values if o in recreated_benchling_options_set
+        ]
+        for option in options_to_archive:
             ops.append(
                 CompareOperation(
-                    op=CreateDropdown(
-                        model_dropdown.__benchling_name__,
-                        model_dropdown.__allowed_values__,
+                    op=ArchiveDropdownOption(
+                        dropdown_name,
+                        option,
+                        index=benchling_options.index(option),
+                    ),
+                    reverse_op=CreateDropdownOption(
+                        dropdown_name,
+                        option,
+                        index=benchling_options.index(option),
+                    ),
+                )
+            )
+        for option in options_to_create:
+            ops.append(
+                CompareOperation(
+                    op=CreateDropdownOption(
+                        dropdown_name,
+                        option,
+                        index=allowed_values.index(option),
+                    ),
+                    reverse_op=ArchiveDropdownOption(
+                        dropdown_name,
+                        option,
+                        index=allowed_values.index(option),
+                    ),
+                )
+            )
+        if recreated_benchling_options != recreated_model_options:
+            ops.append(
+                CompareOperation(
+                    op=ReorderDropdownOptions(
+                        dropdown_name,
+                        allowed_values,
+                    ),
+                    reverse_op=ReorderDropdownOptions(
+                        dropdown_name,
+                        recreated_benchling_options,
                     ),
-                    reverse_op=ArchiveDropdown(model_dropdown.__benchling_name__),
                 )
             )
-        dropdown_operations[model_dropdown.__name__] = ops
-        processed_benchling_names.add(model_dropdown.__benchling_name__)
     archive_ops: list[CompareOperation] = []
     for dropdown_to_archive in (
-        set(active_benchling_dropdown_names) - processed_benchling_names
+        active_benchling_dropdown_names - processed_benchling_names
     ):
         archive_ops.append(
             CompareOperation(
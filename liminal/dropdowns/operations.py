@@ -23,10 +23,12 @@ from liminal.dropdowns.api import (
 )
 from liminal.dropdowns.utils import (
     ArchiveRecord,
+    cache_benchling_dropdown,
     dropdown_exists_in_benchling,
     get_benchling_dropdown_by_name,
     get_benchling_dropdown_summary_by_name,
     get_schemas_with_dropdown,
+    invalidate_cached_benchling_dropdown,
 )
 
 logger = logging.getLogger(__name__)
@@ -85,6 +87,7 @@ class ArchiveDropdown(BaseOperation):
         dropdown = get_benchling_dropdown_by_name(benchling_service, self.dropdown_name)
         if dropdown.archive_record is not None:
             raise ValueError(f"Dropdown {self.dropdown_name} is already archived.")
+        invalidate_cached_benchling_dropdown(benchling_service, self.dropdown_name)
         return archive_dropdown(benchling_service, dropdown.id)
 
     def validate(self, benchling_service: BenchlingService) -> None:
@@ -110,6 +113,7 @@ class UnarchiveDropdown(BaseOperation):
         dropdown = get_benchling_dropdown_by_name(benchling_service, self.dropdown_name)
         if dropdown.archive_record is None:
             raise ValueError(f"Dropdown {self.dropdown_name} is already active.")
+        invalidate_cached_benchling_dropdown(benchling_service, self.dropdown_name)
         return unarchive_dropdown(benchling_service, dropdown.id)
 
     def describe_operation(self) -> str:
@@ -134,6 +138,7 @@ class UpdateDropdownName(BaseOperation):
             raise ValueError(
                 f"Dropdown {self.new_dropdown_name} already exists in Benchling."
             )
+        invalidate_cached_benchling_dropdown(benchling_service, self.dropdown_name)
         return update_dropdown_name(
             benchling_service, dropdown.id, self.new_dropdown_name
         )
@@ -160,17 +165,22 @@ class CreateDropdownOption(BaseOperation):
 
     def execute(self, benchling_service: BenchlingService) -> dict[str, Dropdown]:
         dropdown = get_benchling_dropdown_by_name(benchling_service, self.dropdown_name)
-        options_for_update: list[DropdownOption] = [
-            o for o in dropdown.options if o.archive_record is None
-        ] + [o for o in dropdown.options if o.archive_record is not None]
-        existing_option = next(
-            (
-                o
-                for o in options_for_update
-                if o.name == self.option_to_add and o.id is not None
-            ),
-            None,
-        )
+        active_options: list[DropdownOption] = []
+        archived_options: list[DropdownOption] = []
+        existing_option: DropdownOption | None = None
+        for o in dropdown.options:
+            if o.archive_record is None:
+                active_options.append(o)
+            else:
+                archived_options.append(o)
+            if o.name == self.option_to_add and o.id is not None:
+                # Active options are submitted first, so an active match takes precedence over an archived one.
+                if existing_option is None or (
+                    existing_option.archive_record is not None
+                    and o.archive_record is None
+                ):
+                    existing_option = o
+        options_for_update = active_options + archived_options
         # If the option exists
         if existing_option:
             # If the option exists and is archived
@@ -190,11 +200,14 @@ class CreateDropdownOption(BaseOperation):
                 self.index, DropdownOption(name=self.option_to_add)
             )
         try:
-            return update_dropdown_options(
+            response = update_dropdown_options(
                 benchling_service, dropdown.id, options_for_update
             )
         except Exception as e:
+            invalidate_cached_benchling_dropdown(benchling_service, self.dropdown_name)
             raise Exception(f"Failed to create dropdown option: {e}")
+        cache_benchling_dropdown(benchling_service, dropdown, options_for_update)
+        return response
 
     def describe_operation(self) -> str:
         return f"{self.dropdown_name}: Creating dropdown option '{self.option_to_add}' at index {self.index}."
@@ -241,16 +254,18 @@ class ArchiveDropdownOption(BaseOperation):
             if selector_option_to_update := resubmit_payload.get(
                 "schemaFieldSelectorOptionToUpdate"
             ):
-                return resubmit_archive_dropdown_option(
+                resubmit_payload = resubmit_archive_dropdown_option(
                     benchling_service,
                     dropdown.id,
                     self.option_to_remove,
                     dropdown.options,
                     selector_option_to_update,
                 )
-            return resubmit_payload
         except Exception as e:
+            invalidate_cached_benchling_dropdown(benchling_service, self.dropdown_name)
             raise Exception(f"Failed to archive dropdown option: {e}")
+        cache_benchling_dropdown(benchling_service, dropdown, dropdown.options)
+        return resubmit_payload
 
     def describe_operation(self) -> str:
         return f"{self.dropdown_name}: Archiving dropdown option '{self.option_to_remove}'."
@@ -292,16 +307,18 @@ class UpdateDropdownOption(BaseOperation):
             if selector_option_to_update := resubmit_payload.get(
                 "schemaFieldSelectorOptionToUpdate"
             ):
-                return resubmit_update_dropdown_option(
+                resubmit_payload = resubmit_update_dropdown_option(
                     benchling_service,
                     dropdown.id,
                     self.old_option_name,
                     dropdown.options,
                     selector_option_to_update,
                 )
-            return resubmit_payload
         except Exception as e:
+            invalidate_cached_benchling_dropdown(benchling_service, self.dropdown_name)
             raise Exception(f"Failed to update dropdown option: {e}")
+        cache_benchling_dropdown(benchling_service, dropdown, dropdown.options)
+        return resubmit_payload
 
     def describe_operation(self) -> str:
         return f"{self.dropdown_name}: Renaming dropdown option from '{self.old_option_name}' to '{self.new_option_name}'."
@@ -320,9 +337,15 @@ class ReorderDropdownOptions(BaseOperation):
     def execute(self, benchling_service: BenchlingService) -> dict[str, Dropdown]:
         dropdown = get_benchling_dropdown_by_name(benchling_service, self.dropdown_name)
         options_for_update = self._get_reordered_options(dropdown)
-        return update_dropdown_options(
-            benchling_service, dropdown.id, options_for_update
-        )
+        try:
+            response = update_dropdown_options(
+                benchling_service, dropdown.id, options_for_update
+            )
+        except Exception:
+            invalidate_cached_benchling_dropdown(benchling_service, self.dropdown_name)
+            raise
+        cache_benchling_dropdown(benchling_service, dropdown, options_for_update)
+        return response
 
     def describe_operation(self) -> str:
         return f"{self.dropdown_name}: Reordering dropdown options."
@@ -332,13 +355,9 @@ class ReorderDropdownOptions(BaseOperation):
 
     def _get_reordered_options(self, dropdown: Dropdown) -> list[DropdownOption]:
         order_dict = {name: index for index, name in enumerate(self.new_order)}
-
-        sorted_options = sorted(
-            [option for option in dropdown.options if option.name in order_dict],
-            key=lambda option: order_dict[option.name],
+        # Options not in the new order sort to the end. The sort is stable, so they keep their existing relative order.
+        remaining_index = len(order_dict)
+        return sorted(
+            dropdown.options,
+            key=lambda option: order_dict.get(option.name, remaining_index),
         )
-        remaining_options = [
-            option for option in dropdown.options if option.name not in order_dict
-        ]
-        sorted_options.extend(remaining_options)
-        return sorted_options
@@ -1,11 +1,25 @@
-from typing import Any
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-import requests
-from benchling_sdk.models import ArchiveRecord as BenchlingArchiveRecord
 from benchling_sdk.models import Dropdown, DropdownOption, DropdownSummary
 from pydantic import BaseModel
 
 from liminal.connection import BenchlingService
+from liminal.connection.benchling_service import INTERNAL_API_TIMEOUT
+
+if TYPE_CHECKING:
+    from liminal.orm.base_model import BaseModel as BenchlingBaseModel
+
+LOGGER = logging.getLogger(__name__)
+
+LIMINAL_CACHE_DIR_ENV_VAR = "LIMINAL_CACHE_DIR"
+LIMINAL_NO_CACHE_ENV_VAR = "LIMINAL_NO_CACHE"
 
 
 class ArchiveRecord(BaseModel):
@@ -15,6 +29,35 @@ class ArchiveRecord(BaseModel):
         return self.model_dump()
 
 
+@dataclass(frozen=True, slots=True)
+class DropdownArchiveRecordData:
+    """A lightweight, read-only representation of an archive record parsed from the internal API."""
+
+    reason: str
+
+
+@dataclass(frozen=True, slots=True)
+class DropdownOptionData:
+    """A lightweight, read-only representation of a dropdown option parsed from the internal API.
+    Attribute names mirror benchling_sdk's DropdownOption."""
+
+    id: str
+    name: str
+    archive_record: DropdownArchiveRecordData | None
+
+
+@dataclass(frozen=True, slots=True)
+class DropdownData:
+    """A lightweight, read-only representation of a dropdown parsed from the internal API.
+    Attribute names mirror benchling_sdk's Dropdown, so it can be read the same way without the cost of building the SDK models.
+    """
+
+    id: str
+    name: str
+    archive_record: DropdownArchiveRecordData | None
+    options: list[DropdownOptionData]
+
+
 def get_benchling_dropdown_id_name_map(
     benchling_service: BenchlingService,
 ) -> dict[str, str]:
@@ -24,29 +67,94 @@ def get_benchling_dropdown_id_name_map(
 def get_benchling_dropdown_summaries(
     benchling_service: BenchlingService,
 ) -> list[DropdownSummary]:
-    return [
-        dropdown
-        for sublist in benchling_service.dropdowns.list()
-        for dropdown in sublist
-    ]
+    """Returns the summaries of all unarchived dropdowns in Benchling.
+    If the internal API is available, all dropdowns are fetched in a single request. Otherwise, the paginated list from the SDK is used.
+    The summaries are fetched once per BenchlingService and reused until invalidate_benchling_dropdown_summaries is called.
+    """
+    if benchling_service._dropdown_summaries is None:
+        if benchling_service.use_internal_api:
+            benchling_service._dropdown_summaries = [
+                DropdownSummary(id=d["id"], name=d["name"])
+                for d in _get_all_dropdowns_json(benchling_service)
+                if not d["archiveRecord"]
+            ]
+        else:
+            benchling_service._dropdown_summaries = [
+                dropdown
+                for sublist in benchling_service.dropdowns.list()
+                for dropdown in sublist
+            ]
+    return list(benchling_service._dropdown_summaries)
+
+
+def invalidate_benchling_dropdown_summaries(
+    benchling_service: BenchlingService,
+) -> None:
+    """Clears the cached dropdown summaries. Must be called after any write that creates, renames, archives, or unarchives a dropdown."""
+    benchling_service._dropdown_summaries = None
+    benchling_service._dropdown_summaries_by_name = None
+
+
+def _get_benchling_dropdown_summaries_by_name(
+    benchling_service: BenchlingService,
+) -> dict[str, DropdownSummary]:
+    if benchling_service._dropdown_summaries_by_name is None:
+        benchling_service._dropdown_summaries_by_name = {
+            d.name: d for d in get_benchling_dropdown_summaries(benchling_service)
+        }
+    return benchling_service._dropdown_summaries_by_name
+
+
+def get_benchling_dropdown_summaries_by_names(
+    benchling_service: BenchlingService, names: set[str]
+) -> dict[str, DropdownSummary]:
+    """Returns a map of name to dropdown summary for the given dropdown names that exist in Benchling.
+    If the summaries are not cached yet and the internal API is not available, the dropdown pages are fetched lazily
+    and scanning stops once every name has been found. If every page ends up being fetched, the summaries are cached
+    as if get_benchling_dropdown_summaries had been called.
+    """
+    if (
+        benchling_service._dropdown_summaries is not None
+        or benchling_service._dropdown_summaries_by_name is not None
+        or benchling_service.use_internal_api
+    ):
+        summaries_by_name = _get_benchling_dropdown_summaries_by_name(benchling_service)
+        return {
+            name: summaries_by_name[name] for name in names if name in summaries_by_name
+        }
+    found: dict[str, DropdownSummary] = {}
+    scanned: list[DropdownSummary] = []
+    for page in benchling_service.dropdowns.list():
+        scanned.extend(page)
+        for dropdown in page:
+            if dropdown.name in names and dropdown.name not in found:
+                found[dropdown.name] = dropdown
+        if len(found) == len(names):
+            break
+    else:
+        benchling_service._dropdown_summaries = scanned
+    return found
 
 
 def get_benchling_dropdown_summary_by_name(
     benchling_service: BenchlingService, name: str
 ) -> DropdownSummary:
-    for dropdown in get_benchling_dropdown_summaries(benchling_service):
-        if dropdown.name == name:
-            return dropdown
-    raise Exception(f"Dropdown {name} not found in given list.")
+    try:
+        return get_benchling_dropdown_summaries_by_names(benchling_service, {name})[
+            name
+        ]
+    except KeyError:
+        raise Exception(f"Dropdown {name} not found in given list.")
 
 
 def get_benchling_dropdown_by_name(
     benchling_service: BenchlingService, name: str
 ) -> Dropdown:
-    dropdown = None
-    for d in get_benchling_dropdown_summaries(benchling_service):
-        if d.name == name:
-            dropdown = d
+    if (cached_dropdown := benchling_service._dropdown_cache.get(name)) is not None:
+        return cached_dropdown
+    dropdown = get_benchling_dropdown_summaries_by_names(benchling_service, {name}).get(
+        name
+    )
     if dropdown is None:
         raise Exception(
             f"Dropdown {name} not found in Benchling {benchling_service.benchling_tenant}."
@@ -54,70 +162,174 @@ def get_benchling_dropdown_by_name(
     return benchling_service.dropdowns.get_by_id(dropdown.id)
 
 
+def cache_benchling_dropdown(
+    benchling_service: BenchlingService,
+    dropdown: Dropdown,
+    options: list[DropdownOption],
+) -> None:
+    """Caches the dropdown with the options that were just written to Benchling,
+    so that the next option operation on the same dropdown does not need to fetch it again.
+    New options do not have an id until the dropdown is fetched from Benchling, so if any option is missing an id the dropdown is evicted instead.
+    """
+    if any(o.id is None for o in options):
+        invalidate_cached_benchling_dropdown(benchling_service, dropdown.name)
+        return
+    dropdown.options = options
+    benchling_service._dropdown_cache[dropdown.name] = dropdown
+
+
+def invalidate_cached_benchling_dropdown(
+    benchling_service: BenchlingService, name: str
+) -> None:
+    benchling_service._dropdown_cache.pop(name, None)
+
+
 def get_benchling_dropdowns_dict(
     benchling_service: BenchlingService,
     include_archived: bool = False,
-) -> dict[str, Dropdown]:
+    use_cache: bool = True,
+) -> dict[str, DropdownData]:
+    def _convert_archive_record_from_json(
+        archive_record: dict[str, Any] | None,
+    ) -> DropdownArchiveRecordData | None:
+        if not archive_record:
+            return None
+        return DropdownArchiveRecordData(reason=archive_record["purpose"])
+
     def _convert_dropdown_from_json(
         d: dict[str, Any], include_archived: bool = False
-    ) -> Dropdown:
-        all_options = d["allSchemaFieldSelectorOptions"]
-        if not include_archived:
-            all_options = [o for o in all_options if not o["archiveRecord"]]
-        return Dropdown(
+    ) -> DropdownData:
+        return DropdownData(
             id=d["id"],
             name=d["name"],
-            archive_record=BenchlingArchiveRecord(reason=d["archiveRecord"]["purpose"])
-            if d["archiveRecord"]
-            else None,
+            archive_record=_convert_archive_record_from_json(d["archiveRecord"]),
             options=[
-                DropdownOption(
-                    name=o["name"],
+                DropdownOptionData(
                     id=o["id"],
-                    archive_record=BenchlingArchiveRecord(
-                        reason=o["archiveRecord"]["purpose"]
-                    )
-                    if o["archiveRecord"]
-                    else None,
+                    name=o["name"],
+                    archive_record=_convert_archive_record_from_json(
+                        o["archiveRecord"]
+                    ),
                 )
-                for o in all_options
+                for o in d["allSchemaFieldSelectorOptions"]
+                if include_archived or not o["archiveRecord"]
             ],
         )
 
-    with requests.Session() as session:
-        request = session.get(
-            f"https://{benchling_service.benchling_tenant}.benchling.com/1/api/schema-field-selectors/?registryId={benchling_service.registry_id}",
-            headers=benchling_service.custom_post_headers,
-            cookies=benchling_service.custom_post_cookies,
-        )
-        all_dropdowns = request.json()["selectorsByRegistryId"][
-            benchling_service.registry_id
-        ]
-        if not include_archived:
-            all_dropdowns = [d for d in all_dropdowns if not d["archiveRecord"]]
-    dropdowns = {
+    return {
         d["name"]: _convert_dropdown_from_json(d, include_archived)
-        for d in all_dropdowns
+        for d in _get_all_dropdowns_json(benchling_service, use_cache)
+        if include_archived or not d["archiveRecord"]
     }
-    return dropdowns
+
+
+def _get_all_dropdowns_json(
+    benchling_service: BenchlingService, use_cache: bool = True
+) -> list[dict[str, Any]]:
+    """Gets the json of all dropdowns in the registry from the internal API.
+    The response is cached on disk along with its ETag. On the next call the ETag is sent with the request,
+    and the cached json is reused if Benchling responds that the dropdowns have not been modified.
+    The disk cache is bypassed if use_cache is False or the LIMINAL_NO_CACHE environment variable is set."""
+    use_cache = use_cache and not _is_cache_disabled()
+    registry_id = benchling_service.registry_id
+    cache_path = _get_dropdowns_cache_path(
+        benchling_service.benchling_tenant, registry_id
+    )
+    cached = _read_dropdowns_cache(cache_path) if use_cache else None
+    headers = dict(benchling_service.custom_post_headers)
+    if cached is not None:
+        headers["If-None-Match"] = cached["etag"]
+    response = benchling_service.http_session.get(
+        f"https://{benchling_service.benchling_tenant}.benchling.com/1/api/schema-field-selectors/?registryId={registry_id}",
+        headers=headers,
+        cookies=benchling_service.custom_post_cookies,
+        timeout=INTERNAL_API_TIMEOUT,
+    )
+    if response.status_code == 304 and cached is not None:
+        return cached["data"]
+    all_dropdowns = response.json()["selectorsByRegistryId"][registry_id]
+    if use_cache and (etag := response.headers.get("ETag")):
+        _write_dropdowns_cache(cache_path, etag, all_dropdowns)
+    return all_dropdowns
+
+
+def _is_cache_disabled() -> bool:
+    return os.environ.get(LIMINAL_NO_CACHE_ENV_VAR, "").lower() not in (
+        "",
+        "0",
+        "false",
+    )
+
+
+def _get_dropdowns_cache_path(tenant_name: str, registry_id: str) -> Path:
+    cache_dir = os.environ.get(LIMINAL_CACHE_DIR_ENV_VAR)
+    base_path = Path(cache_dir) if cache_dir else Path.home() / ".cache" / "liminal"
+    return base_path / tenant_name / registry_id / "dropdowns.json"
+
+
+def _read_dropdowns_cache(cache_path: Path) -> dict[str, Any] | None:
+    try:
+        cached = json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or "etag" not in cached or "data" not in cached:
+        return None
+    return cached
+
+
+def _write_dropdowns_cache(
+    cache_path: Path, etag: str, all_dropdowns: list[dict[str, Any]]
+) -> None:
+    """Writes the cache to a uniquely named temporary file and then replaces the cache file,
+    so that a partially written cache is never read, even when several processes write it at the same time."""
+    tmp_path: Path | None = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=cache_path.parent, suffix=".tmp", delete=False
+        ) as tmp_file:
+            tmp_path = Path(tmp_file.name)
+            json.dump(
+                {"etag": etag, "data": all_dropdowns}, tmp_file, separators=(",", ":")
+            )
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        LOGGER.debug(f"Could not write dropdowns cache to {cache_path}: {e}")
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
 
 
 def dropdown_exists_in_benchling(
     benchling_service: BenchlingService, name: str
 ) -> bool:
-    return name in get_benchling_dropdown_summaries(benchling_service)
+    return name in _get_benchling_dropdown_summaries_by_name(benchling_service)
 
 
 def get_schemas_with_dropdown(dropdown_name: str) -> list[str]:
     from liminal.orm.base_model import BaseModel as BenchlingBaseModel
 
-    schemas_with_dropdown = []
-    for model in BenchlingBaseModel.get_all_subclasses():
-        for props_dict in [
-            m.info["benchling_properties"]
-            for m in list(model.__table__.columns)
-            if len(m.info.keys()) > 0
-        ]:
-            if props_dict.dropdown_link == dropdown_name:
-                schemas_with_dropdown.append(model.__schema_properties__.name)
-    return schemas_with_dropdown
+    models = tuple(BenchlingBaseModel.get_all_subclasses())
+    return list(_get_dropdown_to_schemas_index(models).get(dropdown_name, ()))
+
+
+@lru_cache(maxsize=1)
+def _get_dropdown_to_schemas_index(
+    models: tuple[type["BenchlingBaseModel"], ...],
+) -> dict[str, tuple[str, ...]]:
+    """Builds a map of dropdown name to the names of the schemas that have a field linked to it.
+    The index is keyed on the given models, so it is rebuilt whenever the defined models change.
+    Schema names are stored as tuples so the cached index cannot be mutated by callers."""
+    dropdown_to_schemas: dict[str, list[str]] = {}
+    for model in models:
+        schema_name = model.__schema_properties__.name
+        for column in model.__table__.columns:
+            properties = column.info.get("benchling_properties")
+            if properties is None:
+                continue
+            dropdown_to_schemas.setdefault(properties.dropdown_link, []).append(
+                schema_name
+            )
+    return {
+        dropdown_link: tuple(schema_names)
+        for dropdown_link, schema_names in dropdown_to_schemas.items()
+    }
@@ -1,9 +1,9 @@
 import json
 from typing import Any
 
-import requests
-
 from liminal.connection import BenchlingService
+from liminal.connection.benchling_service import INTERNAL_API_TIMEOUT
+from liminal.entity_schemas.utils import invalidate_tag_schemas
 from liminal.utils import await_queued_response
 
 
@@ -18,6 +18,7 @@ def create_entity_schema(
     )
     if not (200 <= response.status_code < 300):
         raise Exception("Failed to create entity schema:", response.content)
+    invalidate_tag_schemas(benchling_service)
     return json.loads(response.content)
 
 
@@ -27,16 +28,20 @@ def archive_tag_schemas(
     """
     Archive a list of entity schema ids.
     """
-    with requests.Session() as session:
-        response = session.post(
-            f"https://{benchling_service.benchling_tenant}.benchling.com/1/api/tag-schemas:bulk-archive",
-            data=json.dumps({"ids": entity_schema_ids, "purpose": "Made in error"}),
-            headers=benchling_service.custom_post_headers,
-            cookies=benchling_service.custom_post_cookies,
-        )
-        if not response.ok:
-            raise Exception("Failed to archive tag schemas:", response.content)
-        return response.json()
+    response = benchling_service.http_session.post(
+        f"https://{benchling_service.benchling_tenant}.benchling.com/1/api/tag-schemas:bulk-archive",
+        data=json.dumps(
+            {"ids": entity_schema_ids, "purpose": "Made in error"},
+            separators=(",", ":"),
+        ),
+        headers=benchling_service.custom_post_headers,
+        cookies=benchling_service.custom_post_cookies,
+        timeout=INTERNAL_API_TIMEOUT,
+    )
+    if not response.ok:
+        raise Exception("Failed to archive tag schemas:", response.content)
+    invalidate_tag_schemas(benchling_service)
+    return response.json()
 
 
 def unarchive_tag_schemas(
@@ -45,16 +50,17 @@ def unarchive_tag_schemas(
     """
     Unarchive a list of entity schema ids.
     """
-    with requests.Session() as session:
-        response = session.post(
-            f"https://{benchling_service.benchling_tenant}.benchling.com/1/api/tag-schemas:bulk-unarchive",
-            data=json.dumps({"ids": entity_schema_ids}),
-            headers=benchling_service.custom_post_headers,
-            cookies=benchling_service.custom_post_cookies,
-        )
-        if not response.ok:
-            raise Exception("Failed to unarchive tag schemas:", response.content)
-        return response.json()
+    response = benchling_service.http_session.post(
+        f"https://{benchling_service.benchling_tenant}.benchling.com/1/api/tag-schemas:bulk-unarchive",
+        data=json.dumps({"ids": entity_schema_ids}, separators=(",", ":")),
+        headers=benchling_service.custom_post_headers,
+        cookies=benchling_service.custom_post_cookies,
+        timeout=INTERNAL_API_TIMEOUT,
+    )
+    if not response.ok:
+        raise Exception("Failed to unarchive tag schemas:", response.content)
+    invalidate_tag_schemas(benchling_service)
+    return response.json()
 
 
 def update_tag_schema(
@@ -63,18 +69,22 @@ def update_tag_schema(
     """
     Update the tag schema with a new field.
     """
-    with requests.Session() as session:
-        queued_response = session.post(
-            f"https://{benchling_service.benchling_tenant}.benchling.com/1/api/tag-schemas/{entity_schema_id}/actions/update",
-            data=json.dumps(payload),
-            headers=benchling_service.custom_post_headers,
-            cookies=benchling_service.custom_post_cookies,
-        )
-        if not queued_response.ok:
-            raise Exception("Failed to update tag schema:", queued_response.content)
+    queued_response = benchling_service.http_session.post(
+        f"https://{benchling_service.benchling_tenant}.benchling.com/1/api/tag-schemas/{entity_schema_id}/actions/update",
+        data=json.dumps(payload, separators=(",", ":")),
+        headers=benchling_service.custom_post_headers,
+        cookies=benchling_service.custom_post_cookies,
+        timeout=INTERNAL_API_TIMEOUT,
+    )
+    if not queued_response.ok:
+        raise Exception("Failed to update tag schema:", queued_response.content)
+    # The update may already be applied even if waiting for it fails, so the caches are always cleared.
+    try:
         return await_queued_response(
             queued_response.json()["status_url"], benchling_service
         )
+    finally:
+        invalidate_tag_schemas(benchling_service)
 
 
 def set_tag_schema_name_template(
@@ -83,13 +93,14 @@ def set_tag_schema_name_template(
     """
     Update the tag schema name template. Must be in a separate endpoint compared to update_tag_schema.
     """
-    with requests.Session() as session:
-        response = session.post(
-            f"https://{benchling_service.benchling_tenant}.benchling.com/1/api/tag-schemas/{entity_schema_id}/actions/set-name-template",
-            data=json.dumps(payload),
-            headers=benchling_service.custom_post_headers,
-            cookies=benchling_service.custom_post_cookies,
-        )
-        if not response.ok:
-            raise Exception("Failed to set tag schema name template:", response.content)
-        return response.json()
+    response = benchling_service.http_session.post(
+        f"https://{benchling_service.benchling_tenant}.benchling.com/1/api/tag-schemas/{entity_schema_id}/actions/set-name-template",
+        data=json.dumps(payload, separators=(",", ":")),
+        headers=benchling_service.custom_post_headers,
+        cookies=benchling_service.custom_post_cookies,
+        timeout=INTERNAL_API_TIMEOUT,
+    )
+    if not response.ok:
+        raise Exception("Failed to set tag schema name template:", response.content)
+    invalidate_tag_schemas(benchling_service)
+    return response.json()
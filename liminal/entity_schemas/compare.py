@@ -1,4 +1,5 @@
 import logging
+from operator import attrgetter
 
 from liminal.base.compare_operation import CompareOperation
 from liminal.base.properties.base_field_properties import BaseFieldProperties
@@ -17,16 +18,33 @@ from liminal.entity_schemas.operations import (
     UpdateEntitySchemaField,
     UpdateEntitySchemaNameTemplate,
 )
-from liminal.entity_schemas.utils import get_converted_tag_schemas
+from liminal.entity_schemas.utils import (
+    get_converted_tag_schemas,
+    get_schema_content_hash,
+)
 from liminal.enums import BenchlingFieldType
-from liminal.enums.benchling_naming_strategy import BenchlingNamingStrategy
+from liminal.enums.benchling_naming_strategy import (
+    TEMPLATE_BASED_NAMING_STRATEGIES,
+    BenchlingNamingStrategy,
+)
 from liminal.orm.base_model import BaseModel
 from liminal.orm.column import Column
+from liminal.orm.name_template import NameTemplate
+from liminal.orm.schema_properties import SchemaProperties
 from liminal.utils import to_snake_case
 
 LOGGER = logging.getLogger(__name__)
 
 
+def _merged_field_props(
+    old_props: BaseFieldProperties, new_props: BaseFieldProperties
+) -> BaseFieldProperties:
+    """Returns the diff of the given field properties.
+    The merged values come from already validated properties, so model_construct skips re-validating them.
+    """
+    return BaseFieldProperties.model_construct(**old_props.merge(new_props))
+
+
 def compare_entity_schemas(
     benchling_service: BenchlingService, schema_names: set[str] | None = None
 ) -> dict[str, list[CompareOperation]]:
@@ -59,39 +77,61 @@ def compare_entity_schemas(
             "WARNING: No model classes found that inherit from BaseModel. Ensure that the model classes are defined and imported correctly."
         )
 
-    archived_benchling_schema_wh_names = [
-        s.warehouse_name for s, _, _ in benchling_schemas if s._archived is True
-    ]
-    # Running list of schema names from benchling. As each model is checked, remove the schema name from this list.
-    # This is used at the end to check if there are any schemas left (schemas that exist in benchling but not in code) and archive them if they are.
-    running_benchling_schema_names = list(
-        [s.warehouse_name for s, _, _ in benchling_schemas]
-    )
+    benchling_schemas_by_wh_name: dict[
+        str, tuple[SchemaProperties, NameTemplate, dict[str, BaseFieldProperties]]
+    ] = {}
+    archived_benchling_schema_wh_names: set[str] = set()
+    for benchling_schema in benchling_schemas:
+        benchling_schema_wh_name = benchling_schema[0].warehouse_name
+        # setdefault keeps the first schema for a duplicated warehouse name, as the previous next(...) lookup did.
+        benchling_schemas_by_wh_name.setdefault(
+            benchling_schema_wh_name, benchling_schema
+        )
+        if benchling_schema[0]._archived is True:
+            archived_benchling_schema_wh_names.add(benchling_schema_wh_name)
     # Iterate through each benchling model defined in code.
     for model in models:
         ops: list[CompareOperation] = []
+        schema_props = model.__schema_properties__
+        model_wh_name = schema_props.warehouse_name
         model_columns: dict[str, Column] = model.get_columns_dict(
             exclude_base_columns=True
         )
         # Validate the entity_link and dropdown_link reference an entity_schema or dropdown that exists in code.
         model.validate_model_definition()
         # if the model table_name is found in the benchling schemas, check for changes...
-        if (model_wh_name := model.__schema_properties__.warehouse_name) in [
-            s.warehouse_name for s, _, _ in benchling_schemas
-        ]:
+        if (
+            existing_benchling_schema := benchling_schemas_by_wh_name.get(model_wh_name)
+        ) is not None:
             benchling_schema_props, benchling_name_template, benchling_schema_fields = (
-                next(
-                    (s, nt, lof)
-                    for s, nt, lof in benchling_schemas
-                    if s.warehouse_name == model_wh_name
-                )
+                existing_benchling_schema
             )
-            archived_benchling_schema_fields = {
-                k: v for k, v in benchling_schema_fields.items() if v._archived is True
-            }
-            active_benchling_schema_fields = {
-                k: v for k, v in benchling_schema_fields.items() if v._archived is False
-            }
+            archived_benchling_schema_fields: dict[str, BaseFieldProperties] = {}
+            active_benchling_schema_fields: dict[str, BaseFieldProperties] = {}
+            for (
+                benchling_field_name,
+                benchling_field,
+            ) in benchling_schema_fields.items():
+                if benchling_field._archived is True:
+                    archived_benchling_schema_fields[benchling_field_name] = (
+                        benchling_field
+                    )
+                elif benchling_field._archived is False:
+                    active_benchling_schema_fields[benchling_field_name] = (
+                        benchling_field
+                    )
+            # If the Benchling schema is active and its content hash matches the model, there is nothing to compare.
+            if (
+                model_wh_name not in archived_benchling_schema_wh_names
+                and model.content_hash()
+                == get_schema_content_hash(
+                    benchling_schema_props,
+                    benchling_name_template,
+                    active_benchling_schema_fields,
+                )
+            ):
+                model_operations[model_wh_name] = ops
+                continue
             if model_wh_name in archived_benchling_schema_wh_names:
                 ops.append(
                     CompareOperation(
@@ -104,8 +144,9 @@ def compare_entity_schemas(
                 benchling_wh_field_name,
                 benchling_field_props,
             ) in active_benchling_schema_fields.items():
+                model_column = model_columns.get(benchling_wh_field_name)
                 # If the benchling field is not found in the model columns, Archive.
-                if benchling_wh_field_name not in model_columns.keys():
+                if model_column is None:
                     ops.append(
                         CompareOperation(
                             op=ArchiveEntitySchemaField(
@@ -121,9 +162,7 @@ def compare_entity_schemas(
 
                 # If the field is found in the model columns, compare benchling to model properties.
                 else:
-                    model_column_props: BaseFieldProperties = model_columns[
-                        benchling_wh_field_name
-                    ].properties
+                    model_column_props: BaseFieldProperties = model_column.properties
                     # If the properties are not the same, Update.
                     if model_column_props != benchling_field_props:
                         ops.append(
@@ -131,35 +170,31 @@ def compare_entity_schemas(
                                 op=UpdateEntitySchemaField(
                                     model_wh_name,
                                     benchling_wh_field_name,
-                                    BaseFieldProperties(
-                                        **benchling_field_props.merge(
-                                            model_column_props
-                                        )
+                                    _merged_field_props(
+                                        benchling_field_props, model_column_props
                                     ),
                                 ),
                                 reverse_op=UpdateEntitySchemaField(
                                     model_wh_name,
                                     benchling_wh_field_name,
-                                    BaseFieldProperties(
-                                        **model_column_props.merge(
-                                            benchling_field_props
-                                        )
+                                    _merged_field_props(
+                                        model_column_props, benchling_field_props
                                     ),
                                 ),
                             )
                         )
+            model_column_names = list(model_columns)
+            shared_fields = benchling_schema_fields.keys() & model_columns.keys()
             recreated_benchling_fields = [
-                f for f in benchling_schema_fields.keys() if f in model_columns.keys()
+                f for f in benchling_schema_fields if f in shared_fields
             ]
             recreated_model_fields = [
-                f for f in model_columns.keys() if f in recreated_benchling_fields
+                f for f in model_column_names if f in shared_fields
             ]
             if recreated_model_fields != recreated_benchling_fields:
                 ops.append(
                     CompareOperation(
-                        op=ReorderEntitySchemaFields(
-                            model_wh_name, list(model_columns.keys())
-                        ),
+                        op=ReorderEntitySchemaFields(model_wh_name, model_column_names),
                         reverse_op=ReorderEntitySchemaFields(
                             model_wh_name, recreated_benchling_fields
                         ),
@@ -168,86 +203,78 @@ def compare_entity_schemas(
             columns_missing_from_benchling_schema = (
                 model_columns.keys() - active_benchling_schema_fields.keys()
             )
+            model_column_indexes = {
+                column_name: index
+                for index, column_name in enumerate(model_column_names)
+            }
             # If the model column is not found in the benchling schema, Add.
             for column_name in columns_missing_from_benchling_schema:
-                if column_name in archived_benchling_schema_fields.keys():
+                column_index = model_column_indexes[column_name]
+                archived_field_props = archived_benchling_schema_fields.get(column_name)
+                model_column_props = model_columns[column_name].properties
+                if archived_field_props is not None:
                     ops.append(
                         CompareOperation(
                             op=UnarchiveEntitySchemaField(
                                 model_wh_name,
                                 column_name,
-                                index=list(model_columns.keys()).index(column_name),
+                                index=column_index,
                             ),
                             reverse_op=ArchiveEntitySchemaField(
                                 model_wh_name,
                                 column_name,
-                                index=list(model_columns.keys()).index(column_name),
+                                index=column_index,
                             ),
                         )
                     )
-                    if (
-                        archived_benchling_schema_fields[column_name]
-                        != model_columns[column_name].properties
-                    ):
+                    if archived_field_props != model_column_props:
                         ops.append(
                             CompareOperation(
                                 op=UpdateEntitySchemaField(
                                     model_wh_name,
                                     column_name,
-                                    BaseFieldProperties(
-                                        **archived_benchling_schema_fields[
-                                            column_name
-                                        ].merge(model_columns[column_name].properties)
+                                    _merged_field_props(
+                                        archived_field_props, model_column_props
                                     ),
                                 ),
                                 reverse_op=UpdateEntitySchemaField(
                                     model_wh_name,
                                     column_name,
-                                    BaseFieldProperties(
-                                        **model_columns[column_name].properties.merge(
-                                            archived_benchling_schema_fields[
-                                                column_name
-                                            ]
-                                        )
+                                    _merged_field_props(
+                                        model_column_props, archived_field_props
                                     ),
                                 ),
                             )
                         )
                 else:
-                    new_field_props = model_columns[
-                        column_name
-                    ].properties.set_warehouse_name(column_name)
+                    new_field_props = model_column_props.set_warehouse_name(column_name)
                     ops.append(
                         CompareOperation(
                             op=CreateEntitySchemaField(
                                 model_wh_name,
                                 field_props=new_field_props,
-                                index=list(model_columns.keys()).index(column_name),
+                                index=column_index,
                             ),
                             reverse_op=ArchiveEntitySchemaField(
                                 model_wh_name,
                                 column_name,
-                                index=list(model_columns.keys()).index(column_name),
+                                index=column_index,
                             ),
                         )
                     )
-            if benchling_schema_props != model.__schema_properties__:
+            if benchling_schema_props != schema_props:
                 ops.append(
                     CompareOperation(
                         op=UpdateEntitySchema(
-                            model.__schema_properties__.warehouse_name,
+                            model_wh_name,
                             BaseSchemaProperties(
-                                **benchling_schema_props.merge(
-                                    model.__schema_properties__
-                                )
+                                **benchling_schema_props.merge(schema_props)
                             ),
                         ),
                         reverse_op=UpdateEntitySchema(
-                            model.__schema_properties__.warehouse_name,
+                            model_wh_name,
                             BaseSchemaProperties(
-                                **model.__schema_properties__.merge(
-                                    benchling_schema_props
-                                )
+                                **schema_props.merge(benchling_schema_props)
                             ),
                         ),
                     ),
@@ -256,13 +283,13 @@ def compare_entity_schemas(
                 ops.append(
                     CompareOperation(
                         op=UpdateEntitySchemaNameTemplate(
-                            model.__schema_properties__.warehouse_name,
+                            model_wh_name,
                             BaseNameTemplate(
                                 **benchling_name_template.merge(model.__name_template__)
                             ),
                         ),
                         reverse_op=UpdateEntitySchemaNameTemplate(
-                            model.__schema_properties__.warehouse_name,
+                            model_wh_name,
                             BaseNameTemplate(
                                 **model.__name_template__.merge(benchling_name_template)
                             ),
@@ -271,57 +298,42 @@ def compare_entity_schemas(
                 )
         # If the model is not found as the benchling schema, Create.
         else:
-            field_props = [
-                col.properties.set_warehouse_name(wh_name)
-                for wh_name, col in model_columns.items()
-            ]
-            tooltips_to_update = {
-                p.warehouse_name: p.tooltip
-                for p in field_props
-                if (p.tooltip and p.warehouse_name)
-            }
-            entity_links_to_update = {
-                p.warehouse_name: p.entity_link
-                for p in field_props
-                if (p.entity_link and p.warehouse_name)
-            }
-            field_type_to_update = {
-                p.warehouse_name: p.type
-                for p in field_props
-                if (p.entity_link and p.warehouse_name)
-            }
-            unit_names_to_update = {
-                p.warehouse_name: p.unit_name
-                for p in field_props
-                if (p.unit_name and p.warehouse_name)
-            }
-            field_props = [
-                f.unset_tooltip().unset_entity_link().unset_unit_name()
-                for f in field_props
-            ]
-            field_props = [
-                f.set_type(BenchlingFieldType.ENTITY_LINK) if f.entity_link else f
-                for f in field_props
-            ]
-            template_based_naming_strategies = {
-                s
-                for s in model.__schema_properties__.naming_strategies
-                if BenchlingNamingStrategy.is_template_based(s)
-            }
+            # Tooltips, entity links, and units are set after the schema is created, so they are collected and unset from the create fields in one pass.
+            field_props: list[BaseFieldProperties] = []
+            tooltips_to_update: dict[str, str] = {}
+            entity_links_to_update: dict[str, str] = {}
+            field_type_to_update: dict[str, BenchlingFieldType | None] = {}
+            unit_names_to_update: dict[str, str] = {}
+            for wh_name, col in model_columns.items():
+                props = col.properties.set_warehouse_name(wh_name)
+                if props.tooltip:
+                    tooltips_to_update[wh_name] = props.tooltip
+                if props.entity_link:
+                    entity_links_to_update[wh_name] = props.entity_link
+                    field_type_to_update[wh_name] = props.type
+                if props.unit_name:
+                    unit_names_to_update[wh_name] = props.unit_name
+                props = props.unset_deferred()
+                if props.entity_link:
+                    props = props.set_type(BenchlingFieldType.ENTITY_LINK)
+                field_props.append(props)
+            template_based_naming_strategies = (
+                TEMPLATE_BASED_NAMING_STRATEGIES.intersection(
+                    schema_props.naming_strategies
+                )
+            )
             standard_naming_strategies = (
-                set(model.__schema_properties__.naming_strategies)
-                - template_based_naming_strategies
+                set(schema_props.naming_strategies) - template_based_naming_strategies
             )
             # If the only naming strategies are template based, temporarily set to NEW_IDS until this gets set in the UpdateEntitySchema operation.
             # Validating that a schemas has at least one naming strategy is done upstream in BaseModel.
             if len(standard_naming_strategies) == 0:
                 standard_naming_strategies = {BenchlingNamingStrategy.NEW_IDS}
-            model_wh_name = model.__schema_properties__.warehouse_name
-            benchling_given_wh_name = to_snake_case(model.__schema_properties__.name)
+            benchling_given_wh_name = to_snake_case(schema_props.name)
             ops.append(
                 CompareOperation(
                     op=CreateEntitySchema(
-                        BaseSchemaProperties(**model.__schema_properties__.model_dump())
+                        BaseSchemaProperties(**schema_props.model_dump())
                         .set_warehouse_name(benchling_given_wh_name)
                         .set_naming_strategies(standard_naming_strategies),
                         fields=field_props,
@@ -333,20 +345,19 @@ def compare_entity_schemas(
             # Benchling api also does not allow for setting the name template.
             # Because of this, we need to run a separate UpdateEntitySchema to set the warehouse_name if it is different from the snakecase version of the model name.
             # We also need to set the template based naming_strategies separately, since the name template must first be set.
-            new_schema_props = BaseSchemaProperties()
-            rollback_schema_props = BaseSchemaProperties()
+            # The empty diffs below hold no values to validate, so they are built with model_construct.
+            new_schema_props = BaseSchemaProperties.model_construct()
+            rollback_schema_props = BaseSchemaProperties.model_construct()
+            has_schema_update = False
             if model_wh_name != benchling_given_wh_name:
                 new_schema_props.warehouse_name = model_wh_name
                 rollback_schema_props.warehouse_name = benchling_given_wh_name
-            if (
-                model.__schema_properties__.naming_strategies
-                - standard_naming_strategies
-            ):
-                new_schema_props.naming_strategies = (
-                    model.__schema_properties__.naming_strategies
-                )
+                has_schema_update = True
+            if schema_props.naming_strategies - standard_naming_strategies:
+                new_schema_props.naming_strategies = schema_props.naming_strategies
                 rollback_schema_props.naming_strategies = standard_naming_strategies
-            if new_schema_props.model_dump(exclude_unset=True) != {}:
+                has_schema_update = True
+            if has_schema_update:
                 ops.append(
                     CompareOperation(
                         op=UpdateEntitySchema(
@@ -366,8 +377,8 @@ def compare_entity_schemas(
                 set(tooltips_to_update.keys()), set(unit_names_to_update.keys())
             )
             for wh_field_name in wh_field_names_to_update:
-                new_field_props = BaseFieldProperties()
-                rollback_field_props = BaseFieldProperties()
+                new_field_props = BaseFieldProperties.model_construct()
+                rollback_field_props = BaseFieldProperties.model_construct()
                 if entity_link_value := entity_links_to_update.get(wh_field_name):
                     new_field_props.entity_link = entity_link_value
                     new_field_props.type = new_field_props.type = (
@@ -391,7 +402,7 @@ def compare_entity_schemas(
                         ),
                     )
                 )
-            benchling_given_name_template = BaseNameTemplate(
+            benchling_given_name_template = BaseNameTemplate.model_construct(
                 parts=[], order_name_parts_by_sequence=False
             )
             # Benchling api also does not allow for setting the name template when Creating an Entity Schema, since it is a different endpoint.
@@ -418,16 +429,15 @@ def compare_entity_schemas(
                     )
                 )
 
-        model_operations[model.__schema_properties__.warehouse_name] = ops
-        running_benchling_schema_names = [
-            schema_name
-            for schema_name in running_benchling_schema_names
-            if schema_name != model.__schema_properties__.warehouse_name
-        ]
+        model_operations[model_wh_name] = ops
     # Benchling schemas that exist that aren't found as a model, Archive.
+    # model_operations is keyed by the warehouse name of every model that was compared, so any other benchling schema is missing from code.
     archive_schema_ops: list[CompareOperation] = []
-    for schema_name in running_benchling_schema_names:
-        if schema_name not in archived_benchling_schema_wh_names:
+    for schema_name in benchling_schemas_by_wh_name:
+        if (
+            schema_name not in model_operations
+            and schema_name not in archived_benchling_schema_wh_names
+        ):
             archive_schema_ops.append(
                 CompareOperation(
                     op=ArchiveEntitySchema(schema_name),
@@ -435,4 +445,6 @@ def compare_entity_schemas(
                 )
             )
     model_operations["Archive"] = archive_schema_ops
-    return {k: sorted(v) for k, v in model_operations.items()}
+    for ops in model_operations.values():
+        ops.sort(key=attrgetter("op.order"))
+    return model_operations
@@ -6,7 +6,10 @@ from pydantic import BaseModel
 
 from liminal.base.properties.base_field_properties import BaseFieldProperties
 from liminal.connection import BenchlingService
-from liminal.dropdowns.utils import get_benchling_dropdown_summary_by_name
+from liminal.dropdowns.utils import (
+    get_benchling_dropdown_summaries_by_names,
+    get_benchling_dropdown_summary_by_name,
+)
 from liminal.entity_schemas.tag_schema_models import TagSchemaModel
 from liminal.enums import BenchlingEntityType
 from liminal.enums.sequence_constraint import SequenceConstraint
@@ -89,6 +92,8 @@ class CreateEntitySchemaFieldModel(BaseModel):
         cls,
         field_props: BaseFieldProperties,
         benchling_service: BenchlingService | None = None,
+        entity_link_schema_ids: dict[str, str] | None = None,
+        dropdown_ids: dict[str, str] | None = None,
     ) -> CreateEntitySchemaFieldModel:
         """Generates a CreateEntitySchemaFieldModel from the given internal definition of benchling field properties.
 
@@ -98,6 +103,10 @@ class CreateEntitySchemaFieldModel(BaseModel):
             The field properties.
         benchling_service : BenchlingService | None
             The Benchling service instance used to fetch additional data if needed.
+        entity_link_schema_ids : dict[str, str] | None
+            Map of already resolved entity link warehouse names to schema ids.
+        dropdown_ids : dict[str, str] | None
+            Map of already resolved dropdown names to dropdown ids.
 
         Returns
         -------
@@ -107,26 +116,32 @@ class CreateEntitySchemaFieldModel(BaseModel):
         tag_schema = None
         folder_item_type = None
         if field_props.entity_link is not None:
-            if benchling_service is None:
-                raise ValueError(
-                    "Benchling SDK must be provided to update entity link field."
-                )
-            entity_link_schema_id = TagSchemaModel.get_one(
-                benchling_service, field_props.entity_link
-            ).id
+            entity_link_schema_id = (entity_link_schema_ids or {}).get(
+                field_props.entity_link
+            )
+            if entity_link_schema_id is None:
+                if benchling_service is None:
+                    raise ValueError(
+                        "Benchling SDK must be provided to update entity link field."
+                    )
+                entity_link_schema_id = TagSchemaModel.get_one(
+                    benchling_service, field_props.entity_link
+                ).id
             tag_schema = {"id": entity_link_schema_id}
         if field_props.type:
             folder_item_type = convert_field_type_to_api_field_type(field_props.type)[1]
 
         dropdown_summary_id = None
         if field_props.dropdown_link is not None:
-            if benchling_service is None:
-                raise ValueError(
-                    "Benchling SDK must be provided to update dropdown field."
-                )
-            dropdown_summary_id = get_benchling_dropdown_summary_by_name(
-                benchling_service, field_props.dropdown_link
-            ).id
+            dropdown_summary_id = (dropdown_ids or {}).get(field_props.dropdown_link)
+            if dropdown_summary_id is None:
+                if benchling_service is None:
+                    raise ValueError(
+                        "Benchling SDK must be provided to update dropdown field."
+                    )
+                dropdown_summary_id = get_benchling_dropdown_summary_by_name(
+                    benchling_service, field_props.dropdown_link
+                ).id
         unit_id = None
         if field_props.unit_name is not None:
             if benchling_service is None:
@@ -187,6 +202,27 @@ class CreateEntitySchemaModel(BaseModel):
         CreateEntitySchemaModel
             A pydantic model for the create entity schema endpoint.
         """
+        entity_links = {f.entity_link for f in fields if f.entity_link is not None}
+        dropdown_links = {
+            f.dropdown_link for f in fields if f.dropdown_link is not None
+        }
+        entity_link_schema_ids: dict[str, str] = {}
+        if entity_links:
+            schemas_data = TagSchemaModel.get_all_json(benchling_service)
+            entity_link_schema_ids = {
+                entity_link: TagSchemaModel.get_one(
+                    benchling_service, entity_link, schemas_data
+                ).id
+                for entity_link in entity_links
+            }
+        dropdown_ids: dict[str, str] = {}
+        if dropdown_links:
+            dropdown_ids = {
+                name: summary.id
+                for name, summary in get_benchling_dropdown_summaries_by_names(
+                    benchling_service, dropdown_links
+                ).items()
+            }
         return cls(
             name=benchling_props.name,
             prefix=benchling_props.prefix,
@@ -202,7 +238,10 @@ class CreateEntitySchemaModel(BaseModel):
             ),
             fields=[
                 CreateEntitySchemaFieldModel.from_benchling_props(
-                    field_props, benchling_service
+                    field_props,
+                    benchling_service,
+                    entity_link_schema_ids,
+                    dropdown_ids,
                 )
                 for field_props in fields
             ],
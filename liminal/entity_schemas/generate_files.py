@@ -1,53 +1,82 @@
-import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from rich import print
 
+from liminal.base.properties.base_field_properties import BaseFieldProperties
 from liminal.connection.benchling_service import BenchlingService
 from liminal.dropdowns.utils import get_benchling_dropdowns_dict
 from liminal.entity_schemas.utils import get_converted_tag_schemas
 from liminal.enums import BenchlingEntityType, BenchlingFieldType
 from liminal.mappers import convert_benchling_type_to_python_type
 from liminal.orm.name_template import NameTemplate
+from liminal.orm.schema_properties import SchemaProperties
 from liminal.utils import to_pascal_case, to_snake_case
 
 
+TYPE_TO_MIXIN_MAP = {
+    BenchlingEntityType.ENTRY: "EntryMixin",
+    BenchlingEntityType.MIXTURE: "MixtureMixin",
+    BenchlingEntityType.MOLECULE: "MoleculeMixin",
+    BenchlingEntityType.CUSTOM_ENTITY: "CustomEntityMixin",
+    BenchlingEntityType.DNA_SEQUENCE: "DnaSequenceMixin",
+    BenchlingEntityType.DNA_OLIGO: "DnaOligoMixin",
+    BenchlingEntityType.RNA_OLIGO: "RnaOligoMixin",
+    BenchlingEntityType.RNA_SEQUENCE: "RnaSequenceMixin",
+    BenchlingEntityType.AA_SEQUENCE: "AaSequenceMixin",
+}
+
+TYPE_TO_SUBDIR_MAP = {
+    BenchlingEntityType.CUSTOM_ENTITY: "custom_entities",
+    BenchlingEntityType.DNA_SEQUENCE: "dna_sequences",
+    BenchlingEntityType.DNA_OLIGO: "dna_oligos",
+    BenchlingEntityType.RNA_OLIGO: "rna_oligos",
+    BenchlingEntityType.RNA_SEQUENCE: "rna_sequences",
+    BenchlingEntityType.AA_SEQUENCE: "aa_sequences",
+    BenchlingEntityType.ENTRY: "entries",
+    BenchlingEntityType.MIXTURE: "mixtures",
+    BenchlingEntityType.MOLECULE: "molecules",
+}
+
+
 def get_entity_mixin(entity_type: BenchlingEntityType) -> str:
-    type_to_mixin_map = {
-        BenchlingEntityType.ENTRY: "EntryMixin",
-        BenchlingEntityType.MIXTURE: "MixtureMixin",
-        BenchlingEntityType.MOLECULE: "MoleculeMixin",
-        BenchlingEntityType.CUSTOM_ENTITY: "CustomEntityMixin",
-        BenchlingEntityType.DNA_SEQUENCE: "DnaSequenceMixin",
-        BenchlingEntityType.DNA_OLIGO: "DnaOligoMixin",
-        BenchlingEntityType.RNA_OLIGO: "RnaOligoMixin",
-        BenchlingEntityType.RNA_SEQUENCE: "RnaSequenceMixin",
-        BenchlingEntityType.AA_SEQUENCE: "AaSequenceMixin",
-    }
-    if entity_type not in type_to_mixin_map:
+    try:
+        return TYPE_TO_MIXIN_MAP[entity_type]
+    except KeyError:
         raise ValueError(f"Unknown entity type: {entity_type}")
-    return type_to_mixin_map[entity_type]
 
 
 def get_file_subdirectory(entity_type: BenchlingEntityType) -> str:
-    type_to_subdir_map = {
-        BenchlingEntityType.CUSTOM_ENTITY: "custom_entities",
-        BenchlingEntityType.DNA_SEQUENCE: "dna_sequences",
-        BenchlingEntityType.DNA_OLIGO: "dna_oligos",
-        BenchlingEntityType.RNA_OLIGO: "rna_oligos",
-        BenchlingEntityType.RNA_SEQUENCE: "rna_sequences",
-        BenchlingEntityType.AA_SEQUENCE: "aa_sequences",
-        BenchlingEntityType.ENTRY: "entries",
-        BenchlingEntityType.MIXTURE: "mixtures",
-        BenchlingEntityType.MOLECULE: "molecules",
-    }
-    if entity_type not in type_to_subdir_map:
+    try:
+        return TYPE_TO_SUBDIR_MAP[entity_type]
+    except KeyError:
         raise ValueError(f"Unknown entity type: {entity_type}")
-    return type_to_subdir_map[entity_type]
 
 
 TAB = "    "
 
+_MODEL_FILE_TEMPLATE = """{import_string}
+
+
+class {classname}(BaseModel, {mixin_name}):
+    __schema_properties__ = {schema_properties}
+    {name_template_string}
+
+{columns_string}
+
+{relationship_string}
+
+{init_string}
+
+"""
+
+_BASE_IMPORTS = (
+    "from sqlalchemy import Column as SqlColumn",
+    "from liminal.orm.column import Column",
+    "from liminal.orm.base_model import BaseModel",
+    "from liminal.orm.schema_properties import SchemaProperties",
+)
+
 
 def generate_all_entity_schema_files(
     benchling_service: BenchlingService, write_path: Path, overwrite: bool = False
@@ -63,180 +92,262 @@ def generate_all_entity_schema_files(
         The path to write the generated files to. entity_schemas/ directory will be created within this path.
     overwrite : bool
         Whether to overwrite existing files in the entity_schemas/ directory.
+        Files whose content is unchanged are left untouched, and files that are no longer generated are removed.
     """
     write_path = write_path / "entity_schemas"
-    if write_path.exists() and overwrite:
-        shutil.rmtree(write_path)
-        print(f"[dim]Removed directory: {write_path}")
     if not write_path.exists():
         write_path.mkdir(parents=True, exist_ok=True)
         print(f"[green]Created directory: {write_path}")
 
     models = get_converted_tag_schemas(benchling_service)
-    has_date = False
     subdirectory_map: dict[str, list[tuple[str, str]]] = {}
-    subdirectory_num_files_written: dict[str, int] = {}
-    dropdown_name_to_classname_map = _get_dropdown_name_to_classname_map(
-        benchling_service
+    subdirectory_num_files_generated: dict[str, int] = {}
+    num_files_written = 0
+    # Dropdowns are only fetched from Benchling if a schema field links to one.
+    dropdown_name_to_classname_map = (
+        _get_dropdown_name_to_classname_map(benchling_service)
+        if any(
+            col.dropdown_link for _, _, columns in models for col in columns.values()
+        )
+        else {}
     )
+    classnames = [to_pascal_case(sp.name) for sp, _, _ in models]
     wh_name_to_classname: dict[str, str] = {
-        sp.warehouse_name: to_pascal_case(sp.name) for sp, _, _ in models
+        sp.warehouse_name: classname
+        for (sp, _, _), classname in zip(models, classnames)
     }
 
-    for schema_properties, name_template, columns in models:
-        classname = to_pascal_case(schema_properties.name)
-
-    for schema_properties, name_template, columns in models:
-        classname = to_pascal_case(schema_properties.name)
-        filename = to_snake_case(schema_properties.name) + ".py"
-        columns = {key: columns[key] for key in columns}
-        import_strings = [
-            "from sqlalchemy import Column as SqlColumn",
-            "from liminal.orm.column import Column",
-            "from liminal.orm.base_model import BaseModel",
-            "from liminal.orm.schema_properties import SchemaProperties",
-            f"from liminal.orm.mixins import {get_entity_mixin(schema_properties.entity_type)}",
+    # Each schema is rendered from its own data and written to its own file, so the files are generated concurrently.
+    with ThreadPoolExecutor(max_workers=min(32, len(models) or 1)) as executor:
+        futures = [
+            executor.submit(
+                _generate_entity_schema_file,
+                schema_properties,
+                name_template,
+                columns,
+                classname,
+                write_path,
+                overwrite,
+                dropdown_name_to_classname_map,
+                wh_name_to_classname,
+            )
+            for (schema_properties, name_template, columns), classname in zip(
+                models, classnames
+            )
         ]
-        import_strings.append(
-            "from liminal.enums import BenchlingEntityType, BenchlingFieldType"
-        )
-        if "naming_strategies" in schema_properties.model_dump(
-            exclude_unset=True, exclude_defaults=True
-        ):
-            import_strings[-1] = import_strings[-1] + ", BenchlingNamingStrategy"
-
-        init_strings = [f"{TAB}def __init__(", f"{TAB}self,"]
-        column_strings = []
-        dropdowns = []
-        relationship_strings = []
-        for col_name, col in columns.items():
-            column_props = col.column_dump()
-            dropdown_classname = None
-            if col.dropdown_link:
-                dropdown_classname = dropdown_name_to_classname_map[col.dropdown_link]
-                dropdowns.append(dropdown_classname)
-                column_props["dropdown_link"] = dropdown_classname
-            column_props_string = ""
-            for k, v in column_props.items():
-                if k == "dropdown_link":
-                    column_props_string += f"""dropdown={v}, """
-                else:
-                    column_props_string += f"""{k}={v.__repr__()}, """
-            column_string = f"""{TAB}{col_name}: SqlColumn = Column({column_props_string.rstrip(", ")})"""
-            column_strings.append(column_string)
-            if col.required and col.type:
-                init_strings.append(
-                    f"""{TAB}{col_name}: {convert_benchling_type_to_python_type(col.type).__name__},"""
-                )
-
-            if (
-                col.type == BenchlingFieldType.DATE
-                or col.type == BenchlingFieldType.DATETIME
-            ):
-                if not has_date:
-                    import_strings.append("from datetime import datetime")
-            if (
-                col.type in BenchlingFieldType.get_entity_link_types()
-                and col.entity_link is not None
-            ):
-                entity_classname = wh_name_to_classname.get(col.entity_link)
-                if entity_classname is not None:
-                    if not col.is_multi:
-                        relationship_strings.append(
-                            f"""{TAB}{col_name}_entity = single_relationship("{wh_name_to_classname[col.entity_link]}", {col_name})"""
-                        )
-                        import_strings.append(
-                            "from liminal.orm.relationship import single_relationship"
-                        )
-                    else:
-                        relationship_strings.append(
-                            f"""{TAB}{col_name}_entities = multi_relationship("{wh_name_to_classname[col.entity_link]}", {col_name})"""
-                        )
-                        import_strings.append(
-                            "from liminal.orm.relationship import multi_relationship"
-                        )
-        for col_name, col in columns.items():
-            if not col.required and col.type:
-                init_strings.append(
-                    f"""{TAB}{col_name}: {convert_benchling_type_to_python_type(col.type).__name__} | None = None,"""
-                )
-        init_strings.append("):")
-        for col_name in columns.keys():
-            init_strings.append(f"{TAB}self.{col_name} = {col_name}")
-        if len(dropdowns) > 0:
-            import_strings.append(f"from ...dropdowns import {', '.join(dropdowns)}")
-        if name_template != NameTemplate():
-            import_strings.append("from liminal.orm.name_template import NameTemplate")
-            parts_imports = [
-                f"from liminal.orm.name_template_parts import {', '.join(set([part.__class__.__name__ for part in name_template.parts]))}"
-            ]
-            import_strings.extend(parts_imports)
-        for col_name, col in columns.items():
-            if col.dropdown_link:
-                init_strings.append(
-                    TAB
-                    + dropdown_name_to_classname_map[col.dropdown_link]
-                    + f".validate({col_name})"
-                )
-
-        columns_string = "\n".join(column_strings)
-        relationship_string = "\n".join(relationship_strings)
-        import_string = "\n".join(list(set(import_strings)))
-        init_string = f"\n{TAB}".join(init_strings) if len(columns) > 0 else ""
-        full_content = f"""{import_string}
-
-
-class {classname}(BaseModel, {get_entity_mixin(schema_properties.entity_type)}):
-    __schema_properties__ = {schema_properties.__repr__()}
-    {f"__name_template__ = {name_template.__repr__()}" if name_template != NameTemplate() else ""}
-
-{columns_string}
-
-{relationship_string}
-
-{init_string}
-
-"""
-        subdirectory_name = get_file_subdirectory(schema_properties.entity_type)
-        write_directory_path = write_path / subdirectory_name
+        results = [future.result() for future in futures]
+    for subdirectory_name, filename, classname, generated, written in results:
         if not subdirectory_map.get(subdirectory_name):
             subdirectory_map[subdirectory_name] = []
-            subdirectory_num_files_written[subdirectory_name] = 0
+            subdirectory_num_files_generated[subdirectory_name] = 0
         subdirectory_map[subdirectory_name].append((filename, classname))
-        write_directory_path.mkdir(exist_ok=True)
-        if overwrite or not (write_directory_path / filename).exists():
-            with open(write_directory_path / filename, "w") as file:
-                file.write(full_content)
-            subdirectory_num_files_written[subdirectory_name] += 1
-
-    for subdir, names in subdirectory_map.items():
-        if subdirectory_num_files_written[subdir] > 0:
-            init_content = (
-                "\n".join(
-                    f"from .{filename[:-3]} import {classname}"
-                    for filename, classname in names
-                )
-                + "\n"
+        if generated:
+            subdirectory_num_files_generated[subdirectory_name] += 1
+        if written:
+            num_files_written += 1
+
+    init_files: list[tuple[Path, str]] = [
+        (
+            write_path / subdir / "__init__.py",
+            "\n".join(
+                f"from .{filename[:-3]} import {classname}"
+                for filename, classname in names
             )
-            with open(write_path / subdir / "__init__.py", "w") as file:
-                file.write(init_content)
+            + "\n",
+        )
+        for subdir, names in subdirectory_map.items()
+        if subdirectory_num_files_generated[subdir] > 0
+    ]
 
-    if sum(subdirectory_num_files_written.values()) > 0:
-        with open(write_path / "__init__.py", "w") as file:
-            file.write(
+    if sum(subdirectory_num_files_generated.values()) > 0:
+        init_files.append(
+            (
+                write_path / "__init__.py",
                 "\n".join(
                     f"from .{subdir} import * # noqa"
                     for subdir in subdirectory_map.keys()
                 )
-                + "\n"
-            )
-            print(
-                f"[green]Generated {write_path / '__init__.py'} with {sum(subdirectory_num_files_written.values())} entity schema files written."
+                + "\n",
             )
+        )
+        # The __init__.py files are independent of each other, so they are written concurrently.
+        with ThreadPoolExecutor(max_workers=min(32, len(init_files))) as executor:
+            list(executor.map(lambda init_file: _write_file(*init_file), init_files))
+        print(
+            f"[green]Generated {write_path / '__init__.py'} with {num_files_written} entity schema files written."
+        )
     else:
         print(
             "[green dim]No new entity schema files to be written. If you want to overwrite existing files, run with -o flag."
         )
+    if overwrite:
+        # Every file is generated when overwriting, so anything else under write_path is stale.
+        generated_paths: set[Path] = set()
+        if subdirectory_map:
+            generated_paths.add(write_path / "__init__.py")
+        for subdir, names in subdirectory_map.items():
+            generated_paths.add(write_path / subdir / "__init__.py")
+            generated_paths.update(
+                write_path / subdir / filename for filename, _ in names
+            )
+        _remove_stale_files(write_path, generated_paths)
+
+
+def _generate_entity_schema_file(
+    schema_properties: SchemaProperties,
+    name_template: NameTemplate,
+    columns: dict[str, BaseFieldProperties],
+    classname: str,
+    write_path: Path,
+    overwrite: bool,
+    dropdown_name_to_classname_map: dict[str, str],
+    wh_name_to_classname: dict[str, str],
+) -> tuple[str, str, str, bool, bool]:
+    """Renders the model file for a single entity schema and writes it to its subdirectory of write_path.
+    Returns the subdirectory name, filename, classname, whether the file was generated, and whether its content was actually written.
+    A generated file is not written if the existing file already has the same content.
+    """
+    filename = to_snake_case(schema_properties.name) + ".py"
+    mixin_name = get_entity_mixin(schema_properties.entity_type)
+    subdirectory_name = get_file_subdirectory(schema_properties.entity_type)
+    enums_import = "from liminal.enums import BenchlingEntityType, BenchlingFieldType"
+    if "naming_strategies" in schema_properties.model_dump(
+        exclude_unset=True, exclude_defaults=True
+    ):
+        enums_import += ", BenchlingNamingStrategy"
+    extra_imports: set[str] = set()
+
+    init_strings = [f"{TAB}def __init__(", f"{TAB}self,"]
+    optional_init_strings = []
+    assignment_strings = []
+    dropdown_validation_strings = []
+    column_strings = []
+    dropdowns = []
+    relationship_strings = []
+    entity_link_types = BenchlingFieldType.get_entity_link_types()
+    for col_name, col in columns.items():
+        column_props = col.column_dump()
+        dropdown_classname = None
+        if col.dropdown_link:
+            dropdown_classname = dropdown_name_to_classname_map[col.dropdown_link]
+            dropdowns.append(dropdown_classname)
+            column_props["dropdown_link"] = dropdown_classname
+            dropdown_validation_strings.append(
+                f"{TAB}{dropdown_classname}.validate({col_name})"
+            )
+        assignment_strings.append(f"{TAB}self.{col_name} = {col_name}")
+        column_props_string = ", ".join(
+            f"dropdown={v}" if k == "dropdown_link" else f"{k}={v!r}"
+            for k, v in column_props.items()
+        )
+        column_string = (
+            f"""{TAB}{col_name}: SqlColumn = Column({column_props_string})"""
+        )
+        column_strings.append(column_string)
+        if col.type:
+            python_type_name = convert_benchling_type_to_python_type(col.type).__name__
+            if col.required:
+                init_strings.append(f"""{TAB}{col_name}: {python_type_name},""")
+            else:
+                optional_init_strings.append(
+                    f"""{TAB}{col_name}: {python_type_name} | None = None,"""
+                )
+
+        if (
+            col.type == BenchlingFieldType.DATE
+            or col.type == BenchlingFieldType.DATETIME
+        ):
+            extra_imports.add("from datetime import datetime")
+        if col.type in entity_link_types and col.entity_link is not None:
+            entity_classname = wh_name_to_classname.get(col.entity_link)
+            if entity_classname is not None:
+                if not col.is_multi:
+                    relationship_strings.append(
+                        f"""{TAB}{col_name}_entity = single_relationship("{entity_classname}", {col_name})"""
+                    )
+                    extra_imports.add(
+                        "from liminal.orm.relationship import single_relationship"
+                    )
+                else:
+                    relationship_strings.append(
+                        f"""{TAB}{col_name}_entities = multi_relationship("{entity_classname}", {col_name})"""
+                    )
+                    extra_imports.add(
+                        "from liminal.orm.relationship import multi_relationship"
+                    )
+    init_strings.extend(optional_init_strings)
+    init_strings.append("):")
+    init_strings.extend(assignment_strings)
+    init_strings.extend(dropdown_validation_strings)
+    if len(dropdowns) > 0:
+        extra_imports.add(
+            f"from ...dropdowns import {', '.join(dict.fromkeys(dropdowns))}"
+        )
+    if name_template != NameTemplate():
+        extra_imports.add("from liminal.orm.name_template import NameTemplate")
+        extra_imports.add(
+            f"from liminal.orm.name_template_parts import {', '.join(sorted({part.__class__.__name__ for part in name_template.parts}))}"
+        )
+
+    columns_string = "\n".join(column_strings)
+    relationship_string = "\n".join(relationship_strings)
+    import_string = "\n".join(
+        (
+            *_BASE_IMPORTS,
+            f"from liminal.orm.mixins import {mixin_name}",
+            enums_import,
+            *sorted(extra_imports),
+        )
+    )
+    init_string = f"\n{TAB}".join(init_strings) if len(columns) > 0 else ""
+    full_content = _MODEL_FILE_TEMPLATE.format(
+        import_string=import_string,
+        classname=classname,
+        mixin_name=mixin_name,
+        schema_properties=repr(schema_properties),
+        name_template_string=f"__name_template__ = {name_template!r}"
+        if name_template != NameTemplate()
+        else "",
+        columns_string=columns_string,
+        relationship_string=relationship_string,
+        init_string=init_string,
+    )
+    write_directory_path = write_path / subdirectory_name
+    generated = overwrite or not (write_directory_path / filename).exists()
+    written = generated and _write_file(write_directory_path / filename, full_content)
+    return subdirectory_name, filename, classname, generated, written
+
+
+def _write_file(path: Path, content: str) -> bool:
+    """Writes the content to the given path, unless the file already has exactly this content.
+    The parent directory is only created if the first write fails because it does not exist.
+    Returns whether the file was written.
+    """
+    encoded_content = content.encode("utf-8")
+    try:
+        if path.read_bytes() == encoded_content:
+            return False
+    except FileNotFoundError:
+        pass
+    try:
+        path.write_bytes(encoded_content)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(encoded_content)
+    return True
+
+
+def _remove_stale_files(write_path: Path, generated_paths: set[Path]) -> None:
+    """Removes the files under write_path that were not generated, along with any directories left empty."""
+    # Reverse sorting visits a directory's contents before the directory itself.
+    for path in sorted(write_path.rglob("*"), reverse=True):
+        if path.is_dir():
+            if not any(path.iterdir()):
+                path.rmdir()
+        elif path not in generated_paths:
+            path.unlink()
+            if path.suffix == ".py":
+                print(f"[dim]Removed file: {path}")
 
 
 def _get_dropdown_name_to_classname_map(
@@ -1,4 +1,7 @@
+from __future__ import annotations
+
 import logging
+from abc import abstractmethod
 from typing import Any, ClassVar
 
 from liminal.base.base_operation import BaseOperation
@@ -24,7 +27,7 @@ from liminal.entity_schemas.utils import (
     convert_tag_schema_field_to_field_properties,
     convert_tag_schema_to_internal_schema,
 )
-from liminal.enums import BenchlingNamingStrategy
+from liminal.enums.benchling_naming_strategy import TEMPLATE_BASED_NAMING_STRATEGIES
 from liminal.orm.schema_properties import SchemaProperties
 from liminal.unit_dictionary.utils import (
     get_unit_id_to_name_map,
@@ -35,6 +38,20 @@ from liminal.utils import to_snake_case
 LOGGER = logging.getLogger(__name__)
 
 
+def _get_schema_identifier_sets(
+    all_schemas: list[dict[str, Any]],
+) -> tuple[set[str], set[str], set[str]]:
+    """Returns the sets of names, warehouse names, and prefixes of the given raw tag schemas, built in a single pass."""
+    schema_names: set[str] = set()
+    schema_wh_names: set[str] = set()
+    schema_prefixes: set[str] = set()
+    for schema in all_schemas:
+        schema_names.add(schema["name"])
+        schema_wh_names.add(schema["sqlIdentifier"])
+        schema_prefixes.add(schema["prefix"])
+    return schema_names, schema_wh_names, schema_prefixes
+
+
 class CreateEntitySchema(BaseOperation):
     order: ClassVar[int] = 80
 
@@ -50,14 +67,14 @@ class CreateEntitySchema(BaseOperation):
         )
 
     def execute(self, benchling_service: BenchlingService) -> dict[str, Any]:
-        try:
-            schema = TagSchemaModel.get_one(
-                benchling_service, self._validated_schema_properties.warehouse_name
-            )
-        except ValueError:
-            schema = None
+        all_schemas = TagSchemaModel.get_all_json(benchling_service)
+        schema = TagSchemaModel.get_one_or_none(
+            benchling_service,
+            self._validated_schema_properties.warehouse_name,
+            all_schemas,
+        )
         if schema is None:
-            self._validate_create(benchling_service)
+            self._validate_create(benchling_service, all_schemas)
             return self._execute_create(benchling_service)
         else:
             self._validate_unarchive(benchling_service, schema)
@@ -99,31 +116,29 @@ class CreateEntitySchema(BaseOperation):
                     f"{self.__class__.__name__} {self._validated_schema_properties.warehouse_name}: On field {field.warehouse_name}, unit {field.unit_name} not found in Benchling Unit Dictionary as a valid unit. Please check the field definition or your Unit Dictionary."
                 )
 
-    def _validate_create(self, benchling_service: BenchlingService) -> None:
-        all_schemas = TagSchemaModel.get_all_json(benchling_service)
-        if self._validated_schema_properties.name in [
-            schema["name"] for schema in all_schemas
-        ]:
+    def _validate_create(
+        self, benchling_service: BenchlingService, all_schemas: list[dict[str, Any]]
+    ) -> None:
+        schema_names, schema_wh_names, schema_prefixes = _get_schema_identifier_sets(
+            all_schemas
+        )
+        if self._validated_schema_properties.name in schema_names:
             raise ValueError(
                 f"Entity schema name {self._validated_schema_properties.name} already exists in Benchling."
             )
-        if self._validated_schema_properties.warehouse_name in [
-            schema["sqlIdentifier"] for schema in all_schemas
-        ]:
+        if self._validated_schema_properties.warehouse_name in schema_wh_names:
             raise ValueError(
                 f"Entity schema warehouse name {self._validated_schema_properties.warehouse_name} already exists in Benchling."
             )
         if (
             not benchling_service.connection.fieldsets
-            and self._validated_schema_properties.prefix
-            in [schema["prefix"] for schema in all_schemas]
+            and self._validated_schema_properties.prefix in schema_prefixes
         ):
             raise ValueError(
                 f"Entity schema prefix {self._validated_schema_properties.prefix} already exists in Benchling."
             )
-        if any(
-            BenchlingNamingStrategy.is_template_based(strategy)
-            for strategy in self._validated_schema_properties.naming_strategies
+        if not TEMPLATE_BASED_NAMING_STRATEGIES.isdisjoint(
+            self._validated_schema_properties.naming_strategies
         ):
             raise ValueError(
                 "Invalid naming strategies for schema. Cannot create entity schema using template-based naming strategies."
@@ -220,7 +235,9 @@ class UpdateEntitySchema(BaseOperation):
         updated_tag_schema = tag_schema.update_schema_props(
             self.update_props.model_dump(exclude_unset=True)
         )
-        update = UpdateTagSchemaModel(**updated_tag_schema.model_dump())
+        update = UpdateTagSchemaModel.model_validate(
+            updated_tag_schema, from_attributes=True
+        )
         return update_tag_schema(benchling_service, tag_schema.id, update.model_dump())
 
     def describe_operation(self) -> str:
@@ -244,22 +261,31 @@ class UpdateEntitySchema(BaseOperation):
         tag_schema = TagSchemaModel.get_one(
             benchling_service, self.wh_schema_name, all_schemas
         )
-        if self.update_props.name and self.update_props.name in [
-            schema["name"] for schema in all_schemas
-        ]:
+        # Most updates do not touch the schema identifiers, so skip building the identifier sets for them.
+        if not (
+            self.update_props.name
+            or self.update_props.warehouse_name
+            or self.update_props.prefix
+        ):
+            return tag_schema
+        schema_names, schema_wh_names, schema_prefixes = _get_schema_identifier_sets(
+            all_schemas
+        )
+        if self.update_props.name and self.update_props.name in schema_names:
             raise ValueError(
                 f"Entity schema name {self.update_props.name} already exists in Benchling."
             )
-        if self.update_props.warehouse_name and self.update_props.warehouse_name in [
-            schema["sqlIdentifier"] for schema in all_schemas
-        ]:
+        if (
+            self.update_props.warehouse_name
+            and self.update_props.warehouse_name in schema_wh_names
+        ):
             raise ValueError(
                 f"Entity schema warehouse name {self.update_props.warehouse_name} already exists in Benchling."
             )
         if (
             not benchling_service.connection.fieldsets
             and self.update_props.prefix
-            and self.update_props.prefix in [schema["prefix"] for schema in all_schemas]
+            and self.update_props.prefix in schema_prefixes
         ):
             raise ValueError(
                 f"Entity schema prefix {self.update_props.prefix} already exists in Benchling."
@@ -299,7 +325,49 @@ class UpdateEntitySchemaNameTemplate(BaseOperation):
         return f"{self.wh_schema_name}: Name template is different in code versus Benchling."
 
 
-class CreateEntitySchemaField(BaseOperation):
+class EntitySchemaFieldOperation(BaseOperation):
+    """A base class for operations that change the fields of a single entity schema.
+    Each operation applies its change to an in-memory tag schema, so that consecutive operations on the same schema
+    can be executed together with a single fetch and a single update of the tag schema fields.
+    """
+
+    wh_schema_name: str
+
+    def execute(self, benchling_service: BenchlingService) -> dict[str, Any]:
+        return self.execute_batch([self], benchling_service)
+
+    @abstractmethod
+    def apply(
+        self, benchling_service: BenchlingService, tag_schema: TagSchemaModel
+    ) -> TagSchemaModel:
+        """Validates and applies the operation to the given tag schema in memory. Returns the updated tag schema."""
+        raise NotImplementedError
+
+    @classmethod
+    def execute_batch(
+        cls,
+        operations: list[EntitySchemaFieldOperation],
+        benchling_service: BenchlingService,
+    ) -> dict[str, Any]:
+        """Executes the given operations, which must all be on the same entity schema, with a single update of the tag schema fields."""
+        wh_schema_names = {o.wh_schema_name for o in operations}
+        if len(wh_schema_names) != 1:
+            raise ValueError(
+                f"Batched field operations must be on a single entity schema, got: {', '.join(sorted(wh_schema_names))}."
+            )
+        tag_schema = TagSchemaModel.get_one(
+            benchling_service, operations[0].wh_schema_name
+        )
+        for operation in operations:
+            tag_schema = operation.apply(benchling_service, tag_schema)
+        return update_tag_schema(
+            benchling_service,
+            tag_schema.id,
+            {"fields": [f.model_dump() for f in tag_schema.allFields]},
+        )
+
+
+class CreateEntitySchemaField(EntitySchemaFieldOperation):
     order: ClassVar[int] = 100
 
     def __init__(
@@ -323,15 +391,12 @@ class CreateEntitySchemaField(BaseOperation):
         else:
             raise ValueError("Field name is required.")
 
-    def execute(self, benchling_service: BenchlingService) -> dict[str, Any]:
-        try:
-            field = TagSchemaModel.get_one(
-                benchling_service, self.wh_schema_name
-            ).get_field(self._wh_field_name)
-        except ValueError:
-            field = None
+    def apply(
+        self, benchling_service: BenchlingService, tag_schema: TagSchemaModel
+    ) -> TagSchemaModel:
+        field = tag_schema.fields_by_system_name.get(self._wh_field_name)
         if field is None:
-            return self._execute_create(benchling_service)
+            return self._apply_create(benchling_service, tag_schema)
         else:
             if field.archiveRecord is None:
                 raise ValueError(
@@ -344,35 +409,23 @@ class CreateEntitySchemaField(BaseOperation):
             ).set_warehouse_name(self._wh_field_name):
                 return UnarchiveEntitySchemaField(
                     self.wh_schema_name, self._wh_field_name, self.index
-                ).execute(benchling_service)
+                ).apply(benchling_service, tag_schema)
             else:
                 raise ValueError(
                     f"Field {self._wh_field_name} on entity schema {self.wh_schema_name} is different in code versus Benchling."
                 )
 
-    def _execute_create(self, benchling_service: BenchlingService) -> dict[str, Any]:
-        tag_schema = TagSchemaModel.get_one(benchling_service, self.wh_schema_name)
-        existing_new_field = next(
-            (f for f in tag_schema.allFields if f.systemName == self._wh_field_name),
-            None,
-        )
-        if existing_new_field:
-            raise ValueError(
-                f"Field {self._wh_field_name} already exists on entity schema {self.wh_schema_name} and is {'archived' if existing_new_field.archiveRecord is not None else 'active'} in Benchling."
-            )
+    def _apply_create(
+        self, benchling_service: BenchlingService, tag_schema: TagSchemaModel
+    ) -> TagSchemaModel:
+        """Inserts the new field into the tag schema. Assumes the field does not already exist, which is checked in apply()."""
         index_to_insert = (
             self.index if self.index is not None else len(tag_schema.allFields)
         )
         new_field = CreateTagSchemaFieldModel.from_props(
             self.field_props, benchling_service
         )
-        fields_for_update = tag_schema.allFields
-        fields_for_update.insert(index_to_insert, new_field)  # type: ignore
-        return update_tag_schema(
-            benchling_service,
-            tag_schema.id,
-            {"fields": [f.model_dump() for f in fields_for_update]},
-        )
+        return tag_schema.insert_field(index_to_insert, new_field)
 
     def describe_operation(self) -> str:
         return f"{self.wh_schema_name}: Creating entity schema field '{self._wh_field_name}' at index {self.index}."
@@ -402,7 +455,7 @@ class CreateEntitySchemaField(BaseOperation):
             )
 
 
-class ArchiveEntitySchemaField(BaseOperation):
+class ArchiveEntitySchemaField(EntitySchemaFieldOperation):
     order: ClassVar[int] = 150
 
     def __init__(
@@ -412,12 +465,10 @@ class ArchiveEntitySchemaField(BaseOperation):
         self.wh_field_name = wh_field_name
         self.index = index
 
-    def execute(self, benchling_service: BenchlingService) -> dict[str, Any]:
-        tag_schema = TagSchemaModel.get_one(benchling_service, self.wh_schema_name)
-        existing_field = next(
-            (f for f in tag_schema.allFields if f.systemName == self.wh_field_name),
-            None,
-        )
+    def apply(
+        self, benchling_service: BenchlingService, tag_schema: TagSchemaModel
+    ) -> TagSchemaModel:
+        existing_field = tag_schema.fields_by_system_name.get(self.wh_field_name)
         if existing_field is None:
             raise ValueError(
                 f"Field {self.wh_field_name} does not exist on entity schema {self.wh_schema_name} in Benchling."
@@ -427,12 +478,7 @@ class ArchiveEntitySchemaField(BaseOperation):
                 f"Field {self.wh_field_name} is already archived on entity schema {self.wh_schema_name}."
             )
         # The query will fail if the field is used in calculated fields or name template or constraints. Not covered atm. TODO
-        updated_tag_schema = tag_schema.archive_field(self.wh_field_name)
-        return update_tag_schema(
-            benchling_service,
-            tag_schema.id,
-            {"fields": [f.model_dump() for f in updated_tag_schema.allFields]},
-        )
+        return tag_schema.archive_field(self.wh_field_name)
 
     def describe_operation(self) -> str:
         return f"{self.wh_schema_name}: Archiving entity schema field '{self.wh_field_name}'."
@@ -453,7 +499,7 @@ class ArchiveEntitySchemaField(BaseOperation):
         return tag_schema
 
 
-class UnarchiveEntitySchemaField(BaseOperation):
+class UnarchiveEntitySchemaField(EntitySchemaFieldOperation):
     order: ClassVar[int] = 130
 
     def __init__(
@@ -463,35 +509,37 @@ class UnarchiveEntitySchemaField(BaseOperation):
         self.wh_field_name = wh_field_name
         self.index = index
 
-    def execute(self, benchling_service: BenchlingService) -> dict[str, Any]:
-        tag_schema = TagSchemaModel.get_one(benchling_service, self.wh_schema_name)
-        existing_field = next(
-            (f for f in tag_schema.allFields if f.systemName == self.wh_field_name),
+    def apply(
+        self, benchling_service: BenchlingService, tag_schema: TagSchemaModel
+    ) -> TagSchemaModel:
+        fields_for_update = tag_schema.allFields
+        existing_index = next(
+            (
+                i
+                for i, f in enumerate(fields_for_update)
+                if f.systemName == self.wh_field_name
+            ),
             None,
         )
-        if existing_field is None:
+        if existing_index is None:
             raise ValueError(
                 f"Field {self.wh_field_name} does not exist on entity schema {self.wh_schema_name} in Benchling."
             )
+        existing_field = fields_for_update[existing_index]
         if existing_field.archiveRecord is None:
             raise ValueError(
                 f"Field {self.wh_field_name} is already active on entity schema {self.wh_schema_name}."
             )
-        updated_tag_schema = tag_schema.unarchive_field(self.wh_field_name)
-        index_to_insert = (
-            self.index if self.index is not None else len(updated_tag_schema.allFields)
-        )
-        fields_for_update = updated_tag_schema.allFields
-        archived_field = next(
-            f for f in fields_for_update if f.systemName == self.wh_field_name
-        )
-        fields_for_update.remove(archived_field)
-        fields_for_update.insert(index_to_insert, archived_field)
-        return update_tag_schema(
-            benchling_service,
-            updated_tag_schema.id,
-            {"fields": [f.model_dump() for f in fields_for_update]},
+        existing_field.archiveRecord = None
+        # Inserting past the end appends, so clamp to the last position to detect when the field is already in place.
+        index_to_insert = min(
+            self.index if self.index is not None else len(fields_for_update),
+            len(fields_for_update) - 1,
         )
+        if index_to_insert != existing_index:
+            fields_for_update.pop(existing_index)
+            fields_for_update.insert(index_to_insert, existing_field)
+        return tag_schema
 
     def describe_operation(self) -> str:
         return f"{self.wh_schema_name}: Unarchiving entity schema field '{self.wh_field_name}'."
@@ -500,7 +548,7 @@ class UnarchiveEntitySchemaField(BaseOperation):
         return f"{self.wh_schema_name}: Entity schema field '{self.wh_field_name}' is archived in Benchling but is defined in code again."
 
 
-class UpdateEntitySchemaField(BaseOperation):
+class UpdateEntitySchemaField(EntitySchemaFieldOperation):
     order: ClassVar[int] = 140
 
     def __init__(
@@ -513,18 +561,15 @@ class UpdateEntitySchemaField(BaseOperation):
         self.wh_field_name = wh_field_name
         self.update_props = update_props
 
-    def execute(self, benchling_service: BenchlingService) -> dict[str, Any]:
-        tag_schema = self._validate(benchling_service)
-        updated_tag_schema = tag_schema.update_field(
+    def apply(
+        self, benchling_service: BenchlingService, tag_schema: TagSchemaModel
+    ) -> TagSchemaModel:
+        self._validate(tag_schema)
+        return tag_schema.update_field(
             benchling_service,
             self.wh_field_name,
             self.update_props.model_dump(exclude_unset=True),
         )
-        return update_tag_schema(
-            benchling_service,
-            tag_schema.id,
-            {"fields": [f.model_dump() for f in updated_tag_schema.allFields]},
-        )
 
     def describe_operation(self) -> str:
         return f"{self.wh_schema_name}: Updating entity schema field '{self.wh_field_name}': {str(self.update_props)}."
@@ -569,49 +614,35 @@ class UpdateEntitySchemaField(BaseOperation):
                     f"{self.__class__.__name__} {self.wh_schema_name}: On field {self.wh_field_name}, unit {self.update_props.unit_name} not found in Benchling Unit Dictionary as a valid unit. Please check the field definition or your Unit Dictionary."
                 )
 
-    def _validate(self, benchling_service: BenchlingService) -> TagSchemaModel:
-        tag_schema = TagSchemaModel.get_one(benchling_service, self.wh_schema_name)
+    def _validate(self, tag_schema: TagSchemaModel) -> None:
         # Only if changing name of field
         if self.update_props.name:
-            existing_new_field = next(
-                (f for f in tag_schema.allFields if f.name == self.update_props.name),
-                None,
-            )
+            existing_new_field = tag_schema.fields_by_name.get(self.update_props.name)
             if existing_new_field:
                 raise ValueError(
                     f"New field name {self.update_props.name} already exists on entity schema {self.wh_schema_name} and is {'archived' if existing_new_field.archiveRecord is not None else 'active'} in Benchling."
                 )
         if self.update_props.warehouse_name:
-            existing_new_field = next(
-                (
-                    f
-                    for f in tag_schema.allFields
-                    if f.systemName == self.update_props.warehouse_name
-                ),
-                None,
+            existing_new_field = tag_schema.fields_by_system_name.get(
+                self.update_props.warehouse_name
             )
             if existing_new_field:
                 raise ValueError(
                     f"New field warehouse name {self.update_props.warehouse_name} already exists on entity schema {self.wh_schema_name} and is {'archived' if existing_new_field.archiveRecord is not None else 'active'} in Benchling."
                 )
-        return tag_schema
 
 
-class ReorderEntitySchemaFields(BaseOperation):
+class ReorderEntitySchemaFields(EntitySchemaFieldOperation):
     order: ClassVar[int] = 160
 
     def __init__(self, wh_schema_name: str, new_order: list[str]) -> None:
         self.wh_schema_name = wh_schema_name
         self.new_order = new_order
 
-    def execute(self, benchling_service: BenchlingService) -> dict[str, Any]:
-        tag_schema = TagSchemaModel.get_one(benchling_service, self.wh_schema_name)
-        updated_tag_schema = tag_schema.reorder_fields(self.new_order)
-        return update_tag_schema(
-            benchling_service,
-            tag_schema.id,
-            {"fields": [f.model_dump() for f in updated_tag_schema.allFields]},
-        )
+    def apply(
+        self, benchling_service: BenchlingService, tag_schema: TagSchemaModel
+    ) -> TagSchemaModel:
+        return tag_schema.reorder_fields(self.new_order)
 
     def describe_operation(self) -> str:
         return f"{self.wh_schema_name}: Reordering fields."
@@ -1,15 +1,15 @@
 from __future__ import annotations
 
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import Any
 
-import requests
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 from liminal.base.properties.base_field_properties import BaseFieldProperties
 from liminal.base.properties.base_name_template import BaseNameTemplate
 from liminal.base.properties.base_schema_properties import BaseSchemaProperties
 from liminal.connection import BenchlingService
+from liminal.connection.benchling_service import INTERNAL_API_TIMEOUT
 from liminal.dropdowns.utils import get_benchling_dropdown_summary_by_name
 from liminal.enums import (
     BenchlingAPIFieldType,
@@ -50,12 +50,23 @@ class NameTemplatePartModel(BaseModel):
 
     @classmethod
     def from_name_template_part(
-        cls, part: NameTemplatePart, fields: list[TagSchemaFieldModel] | None = None
+        cls,
+        part: NameTemplatePart,
+        fields: list[TagSchemaFieldModel] | None = None,
+        fields_by_system_name: dict[str, TagSchemaFieldModel] | None = None,
     ) -> NameTemplatePartModel:
+        """Converts a name template part defined in code to its tag schema representation.
+        If given, fields_by_system_name is used to look up the part's field instead of scanning fields.
+        """
         data = part.model_dump()
         field_id = None
         if wh_field_name := data.get("wh_field_name"):
-            field = next((f for f in fields if f.systemName == wh_field_name), None)
+            if fields_by_system_name is not None:
+                field = fields_by_system_name.get(wh_field_name)
+            else:
+                field = next(
+                    (f for f in fields or [] if f.systemName == wh_field_name), None
+                )
             if field is None:
                 raise ValueError(f"Field {wh_field_name} not found in fields")
             field_id = field.apiId
@@ -75,11 +86,19 @@ class NameTemplatePartModel(BaseModel):
         )
 
     def to_name_template_part(
-        self, fields: list[TagSchemaFieldModel] | None = None
+        self,
+        fields: list[TagSchemaFieldModel] | None = None,
+        fields_by_api_id: dict[str, TagSchemaFieldModel] | None = None,
     ) -> NameTemplatePart:
+        """Converts this tag schema name template part to its representation in code.
+        If given, fields_by_api_id is used to look up the part's field instead of scanning fields.
+        """
         part_cls = NameTemplatePart.resolve_type(self.type)
         if self.fieldId:
-            field = next((f for f in fields if f.apiId == self.fieldId), None)
+            if fields_by_api_id is not None:
+                field = fields_by_api_id.get(self.fieldId)
+            else:
+                field = next((f for f in fields or [] if f.apiId == self.fieldId), None)
             if field is None:
                 raise ValueError(f"Field {self.fieldId} not found in fields")
             return part_cls(wh_field_name=field.systemName, value=self.text)
@@ -396,15 +415,20 @@ class TagSchemaModel(BaseModel):
         cls,
         benchling_service: BenchlingService,
     ) -> list[dict[str, Any]]:
-        with requests.Session() as session:
-            response = session.get(
+        """Returns the raw tag schemas from Benchling.
+        They are fetched once per BenchlingService and reused until invalidate_tag_schemas is called.
+        """
+        if benchling_service._tag_schemas_json is None:
+            response = benchling_service.http_session.get(
                 f"https://{benchling_service.benchling_tenant}.benchling.com/1/api/tag-schemas/",
                 headers=benchling_service.custom_post_headers,
                 cookies=benchling_service.custom_post_cookies,
+                timeout=INTERNAL_API_TIMEOUT,
             )
-        if not response.ok:
-            raise Exception("Failed to get tag schemas.")
-        return response.json()["data"]
+            if not response.ok:
+                raise Exception("Failed to get tag schemas.")
+            benchling_service._tag_schemas_json = response.json()["data"]
+        return benchling_service._tag_schemas_json
 
     @classmethod
     def get_all(
@@ -412,19 +436,22 @@ class TagSchemaModel(BaseModel):
         benchling_service: BenchlingService,
         wh_schema_names: set[str] | None = None,
     ) -> list[TagSchemaModel]:
+        """Returns the tag schemas with the given warehouse names, or all tag schemas if no names are given.
+        Only the requested schemas are validated, and the scan stops once all of them have been found.
+        """
         schemas_data = cls.get_all_json(benchling_service)
         filtered_schemas: list[TagSchemaModel] = []
         if wh_schema_names:
             for schema in schemas_data:
                 if schema["sqlIdentifier"] in wh_schema_names:
                     filtered_schemas.append(cls.model_validate(schema))
-                if len(filtered_schemas) == len(wh_schema_names):
-                    break
+                    if len(filtered_schemas) == len(wh_schema_names):
+                        break
         else:
             for schema in schemas_data:
                 try:
                     filtered_schemas.append(cls.model_validate(schema))
-                except Exception as e:
+                except ValidationError as e:
                     print(f"Error validating schema {schema['sqlIdentifier']}: {e}")
         return filtered_schemas
 
@@ -435,6 +462,21 @@ class TagSchemaModel(BaseModel):
         wh_schema_name: str,
         schemas_data: list[dict[str, Any]] | None = None,
     ) -> TagSchemaModel:
+        schema = cls.get_one_or_none(benchling_service, wh_schema_name, schemas_data)
+        if schema is None:
+            raise ValueError(
+                f"Schema {wh_schema_name} not found in Benchling {benchling_service.benchling_tenant}."
+            )
+        return schema
+
+    @classmethod
+    def get_one_or_none(
+        cls,
+        benchling_service: BenchlingService,
+        wh_schema_name: str,
+        schemas_data: list[dict[str, Any]] | None = None,
+    ) -> TagSchemaModel | None:
+        """Returns the tag schema with the given warehouse name in the service's registry, or None if it does not exist."""
         if schemas_data is None:
             schemas_data = cls.get_all_json(benchling_service)
         schema = next(
@@ -447,9 +489,7 @@ class TagSchemaModel(BaseModel):
             None,
         )
         if schema is None:
-            raise ValueError(
-                f"Schema {wh_schema_name} not found in Benchling {benchling_service.benchling_tenant}."
-            )
+            return None
         return cls.model_validate(schema)
 
     @classmethod
@@ -461,16 +501,35 @@ class TagSchemaModel(BaseModel):
     ) -> TagSchemaModel:
         return cls.get_one(benchling_service, wh_schema_name)
 
+    @cached_property
+    def fields_by_system_name(self) -> dict[str, TagSchemaFieldModel]:
+        """Returns a map of warehouse field name to field for all fields, including archived ones."""
+        return {f.systemName: f for f in reversed(self.allFields)}
+
+    @cached_property
+    def fields_by_name(self) -> dict[str | None, TagSchemaFieldModel]:
+        """Returns a map of field display name to field for all fields, including archived ones."""
+        return {f.name: f for f in reversed(self.allFields)}
+
+    def _invalidate_field_lookups(self) -> None:
+        """Clears the cached field maps. Must be called whenever a field is added or renamed."""
+        self.__dict__.pop("fields_by_system_name", None)
+        self.__dict__.pop("fields_by_name", None)
+
     def get_field(self, wh_field_name: str) -> TagSchemaFieldModel:
         """Returns a field from the tag schema by its warehouse field name."""
-        for field in self.allFields:
-            if field.systemName == wh_field_name:
-                return field
-        raise ValueError(f"Field '{wh_field_name}' not found in schema")
+        field = self.fields_by_system_name.get(wh_field_name)
+        if field is None:
+            raise ValueError(f"Field '{wh_field_name}' not found in schema")
+        return field
 
     def get_internal_name_template_parts(self) -> list[NameTemplatePart]:
+        if not self.nameTemplateParts:
+            return []
+        fields_by_api_id = {f.apiId: f for f in reversed(self.fields) if f.apiId}
         return [
-            part.to_name_template_part(self.fields) for part in self.nameTemplateParts
+            part.to_name_template_part(self.fields, fields_by_api_id)
+            for part in self.nameTemplateParts
         ]
 
     def update_schema_props(self, update_diff: dict[str, Any]) -> TagSchemaModel:
@@ -540,9 +599,12 @@ class TagSchemaModel(BaseModel):
         self, update_name_template: BaseNameTemplate
     ) -> TagSchemaModel:
         update_diff_names = update_name_template.model_dump(exclude_unset=True).keys()
+        fields_by_system_name = {f.systemName: f for f in reversed(self.fields)}
         self.nameTemplateParts = (
             [
-                NameTemplatePartModel.from_name_template_part(part, self.fields)
+                NameTemplatePartModel.from_name_template_part(
+                    part, self.fields, fields_by_system_name
+                )
                 for part in update_name_template.parts
             ]
             if "parts" in update_diff_names
@@ -564,6 +626,7 @@ class TagSchemaModel(BaseModel):
         """Given a warehouse field name and field properties, updates the field of the tag schema. Returns a full TagSchemaModel with the field updated."""
         field = self.get_field(wh_field_name)
         field = field.update_from_props(update_diff, benchling_service)
+        self._invalidate_field_lookups()
         return self
 
     def update_field_wh_name(
@@ -572,6 +635,15 @@ class TagSchemaModel(BaseModel):
         """Updates the warehouse field name of a field in the tag schema. Returns a full TagSchemaModel with the field updated."""
         field = self.get_field(old_wh_field_name)
         field.systemName = new_wh_field_name
+        self._invalidate_field_lookups()
+        return self
+
+    def insert_field(
+        self, index: int, field: TagSchemaFieldModel | CreateTagSchemaFieldModel
+    ) -> TagSchemaModel:
+        """Inserts a new field into the tag schema at the given index. Returns a full TagSchemaModel with the field added."""
+        self.allFields.insert(index, field)  # type: ignore
+        self._invalidate_field_lookups()
         return self
 
     def archive_field(self, wh_field_name: str) -> TagSchemaModel:
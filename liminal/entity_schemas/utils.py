@@ -1,8 +1,13 @@
+import copy
+import hashlib
+import json
 from functools import lru_cache
 
 from benchling_sdk.models import EntitySchema
 
 from liminal.base.properties.base_field_properties import BaseFieldProperties
+from liminal.base.properties.base_name_template import BaseNameTemplate
+from liminal.base.properties.base_schema_properties import BaseSchemaProperties
 from liminal.connection import BenchlingService
 from liminal.dropdowns.utils import get_benchling_dropdown_id_name_map
 from liminal.entity_schemas.tag_schema_models import TagSchemaFieldModel, TagSchemaModel
@@ -26,7 +31,38 @@ def get_converted_tag_schemas(
     """This functions gets all Tag schemas from Benchling and converts them to our internal representation of a schema and its fields.
     It parses the Tag Schema and creates SchemaProperties and a list of FieldProperties for each field in the schema.
     If include_archived is True, it will include archived schemas and archived fields.
+    Results are cached on the BenchlingService per arguments until invalidate_converted_tag_schemas is called.
+    Each call returns its own copy, so callers are free to modify the returned properties.
     """
+    cache_key = (
+        include_archived,
+        frozenset(wh_schema_names) if wh_schema_names else None,
+    )
+    converted_tag_schemas = benchling_service._converted_tag_schemas.get(cache_key)
+    if converted_tag_schemas is None:
+        converted_tag_schemas = _get_converted_tag_schemas(
+            benchling_service, include_archived, wh_schema_names
+        )
+        benchling_service._converted_tag_schemas[cache_key] = converted_tag_schemas
+    return copy.deepcopy(converted_tag_schemas)
+
+
+def invalidate_converted_tag_schemas(benchling_service: BenchlingService) -> None:
+    """Clears the cached converted tag schemas. Must be called after any write to an entity schema or dropdown."""
+    benchling_service._converted_tag_schemas = {}
+
+
+def invalidate_tag_schemas(benchling_service: BenchlingService) -> None:
+    """Clears the cached raw and converted tag schemas. Must be called after any write to an entity schema."""
+    benchling_service._tag_schemas_json = None
+    invalidate_converted_tag_schemas(benchling_service)
+
+
+def _get_converted_tag_schemas(
+    benchling_service: BenchlingService,
+    include_archived: bool,
+    wh_schema_names: set[str] | None,
+) -> list[tuple[SchemaProperties, NameTemplate, dict[str, BaseFieldProperties]]]:
     all_schemas = TagSchemaModel.get_all(benchling_service, wh_schema_names)
     dropdowns_map = get_benchling_dropdown_id_name_map(benchling_service)
     unit_id_to_name_map = get_unit_id_to_name_map(benchling_service)
@@ -138,6 +174,27 @@ def convert_tag_schema_field_to_field_properties(
     )
 
 
+def get_schema_content_hash(
+    schema_properties: BaseSchemaProperties,
+    name_template: BaseNameTemplate,
+    fields: dict[str, BaseFieldProperties],
+) -> str:
+    """Returns a hash of the given schema properties, name template, and ordered fields.
+    Two schemas with the same hash have equal properties, name templates, and fields in the same order.
+    """
+    content = {
+        "schema_properties": schema_properties.model_dump(mode="json"),
+        "name_template": name_template.model_dump(mode="json"),
+        "fields": [
+            [wh_name, field_properties.model_dump(mode="json")]
+            for wh_name, field_properties in fields.items()
+        ],
+    }
+    return hashlib.sha256(
+        json.dumps(content, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
 @lru_cache
 def get_benchling_entity_schemas(
     benchling_service: BenchlingService,
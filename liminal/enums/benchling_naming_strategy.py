@@ -15,18 +15,23 @@ class BenchlingNamingStrategy(StrEnum):
 
     @classmethod
     def is_template_based(cls, strategy: BenchlingNamingStrategy) -> bool:
-        return strategy in [
-            cls.RENAME_WITH_TEMPLATE_WITH_ALIAS,
-            cls.REPLACE_NAMES_WITH_TEMPLATE,
-        ]
+        return strategy in TEMPLATE_BASED_NAMING_STRATEGIES
 
     @classmethod
     def is_valid_set(
         cls, strategies: set[BenchlingNamingStrategy], name_template: bool
     ) -> bool:
         if (
-            any(cls.is_template_based(strategy) for strategy in strategies)
+            not TEMPLATE_BASED_NAMING_STRATEGIES.isdisjoint(strategies)
             and not name_template
         ):
             return False
         return True
+
+
+TEMPLATE_BASED_NAMING_STRATEGIES: frozenset[BenchlingNamingStrategy] = frozenset(
+    {
+        BenchlingNamingStrategy.RENAME_WITH_TEMPLATE_WITH_ALIAS,
+        BenchlingNamingStrategy.REPLACE_NAMES_WITH_TEMPLATE,
+    }
+)
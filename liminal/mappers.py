@@ -1,4 +1,5 @@
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 from sqlalchemy import JSON, DateTime, Float, Integer, String, Boolean
@@ -13,6 +14,7 @@ from liminal.enums import (
 )
 
 
+@lru_cache
 def convert_benchling_type_to_python_type(benchling_type: BenchlingFieldType) -> type:
     benchling_to_python_type_map = {
         BenchlingFieldType.DATE: datetime,
@@ -1,4 +1,6 @@
 import traceback
+from operator import attrgetter
+from typing import cast
 
 from rich import print
 
@@ -7,6 +9,7 @@ from liminal.base.compare_operation import CompareOperation
 from liminal.connection import BenchlingService
 from liminal.dropdowns.compare import compare_dropdowns
 from liminal.entity_schemas.compare import compare_entity_schemas
+from liminal.entity_schemas.operations import EntitySchemaFieldOperation
 
 
 def get_full_migration_operations(
@@ -58,7 +61,8 @@ def get_full_migration_operations(
     all_operations: list[CompareOperation] = (
         dropdown_operations + entity_schema_operations
     )
-    return sorted(all_operations)
+    all_operations.sort(key=attrgetter("op.order"))
+    return all_operations
 
 
 def execute_operations(
@@ -71,20 +75,46 @@ def execute_operations(
 
     print("[bold]Executing operations...")
     index = 1
-    for o in operations:
-        print(f"{index}. {o.describe_operation()}")
+    for batch in _batch_operations(operations):
+        for i, o in enumerate(batch, start=index):
+            print(f"{i}. {o.describe_operation()}")
         try:
-            o.execute(benchling_service)
+            if len(batch) > 1:
+                EntitySchemaFieldOperation.execute_batch(
+                    cast(list[EntitySchemaFieldOperation], batch), benchling_service
+                )
+            else:
+                batch[0].execute(benchling_service)
         except Exception as e:
             traceback.print_exc()
+            steps = (
+                f"steps {index}-{index + len(batch) - 1}"
+                if len(batch) > 1
+                else f"step {index}"
+            )
             print(
-                f"[bold red]Error at step {index} executing operation {o.__class__.__name__}: {e}]"
+                f"[bold red]Error at {steps} executing operation {batch[0].__class__.__name__}: {e}]"
             )
             return False
-        index += 1
+        index += len(batch)
     return True
 
 
+def _batch_operations(operations: list[BaseOperation]) -> list[list[BaseOperation]]:
+    """Groups consecutive field operations of the same type on the same entity schema, so each group can be executed with a single update of the schema's fields.
+    All other operations are placed in their own group.
+    """
+    batches: list[list[BaseOperation]] = []
+    for o in operations:
+        if batches and isinstance(o, EntitySchemaFieldOperation):
+            last = batches[-1][-1]
+            if type(last) is type(o) and last.wh_schema_name == o.wh_schema_name:
+                batches[-1].append(o)
+                continue
+        batches.append([o])
+    return batches
+
+
 def execute_operations_dry_run(
     benchling_service: BenchlingService, operations: list[BaseOperation]
 ) -> None:
@@ -14,8 +14,11 @@ from sqlalchemy.orm.decl_api import declared_attr
 from liminal.base.base_dropdown import BaseDropdown
 from liminal.base.base_validation_filters import BaseValidatorFilters
 from liminal.connection.benchling_service import BenchlingService
-from liminal.entity_schemas.utils import get_benchling_entity_schemas
-from liminal.enums import BenchlingNamingStrategy
+from liminal.entity_schemas.utils import (
+    get_benchling_entity_schemas,
+    get_schema_content_hash,
+)
+from liminal.enums.benchling_naming_strategy import TEMPLATE_BASED_NAMING_STRATEGIES
 from liminal.enums.benchling_entity_type import BenchlingEntityType
 from liminal.enums.sequence_constraint import SequenceConstraint
 from liminal.mappers import entity_type_to_valid_field_types
@@ -47,6 +50,13 @@ class BaseModel(Generic[T], Base):
     _existing_schema_warehouse_names: set[str] = set()
     _existing_schema_names: set[str] = set()
     _existing_schema_prefixes: list[str] = []
+    _subclasses_by_names_cache: dict[
+        tuple[type[BaseModel], frozenset[str]], list[type[BaseModel]]
+    ] = {}
+    _columns_dict_cache: dict[
+        tuple[type[BaseModel], bool, bool], dict[str, Column]
+    ] = {}
+    _content_hash_cache: dict[type[BaseModel], str] = {}
 
     def __init_subclass__(cls, **kwargs: Any):
         super().__init_subclass__(**kwargs)
@@ -127,9 +137,8 @@ class BaseModel(Generic[T], Base):
                         "`amino_acids_exact_match` constraint is only supported for aa_sequence entities."
                     )
         # Validate naming strategies
-        if any(
-            BenchlingNamingStrategy.is_template_based(strategy)
-            for strategy in cls.__schema_properties__.naming_strategies
+        if not TEMPLATE_BASED_NAMING_STRATEGIES.isdisjoint(
+            cls.__schema_properties__.naming_strategies
         ):
             if not cls.__name_template__.parts:
                 raise ValueError(
@@ -154,6 +163,7 @@ class BaseModel(Generic[T], Base):
         cls._existing_schema_warehouse_names.add(warehouse_name)
         cls._existing_schema_names.add(cls.__schema_properties__.name)
         cls._existing_schema_prefixes.append(cls.__schema_properties__.prefix.lower())
+        cls._subclasses_by_names_cache.clear()
 
     @declared_attr
     def creator_id(cls) -> SqlColumn:
@@ -179,23 +189,32 @@ class BaseModel(Generic[T], Base):
 
     @classmethod
     def get_all_subclasses(cls, names: set[str] | None = None) -> list[Type[BaseModel]]:  # noqa: UP006
-        """Returns all subclasses of this class."""
+        """Returns all subclasses of this class.
+        If names are given, only the subclasses matching the given class names or warehouse names are returned.
+        Filtered results are cached until a new subclass is defined.
+        """
         all_subclasses: list[Type[BaseModel]] = cls.__subclasses__()  # noqa: UP006
         if names is None:
             return all_subclasses
-        models = {
-            name: subclass
-            for subclass in all_subclasses
-            for name in names
-            if name
-            in (subclass.__name__, subclass.__schema_properties__.warehouse_name)
-        }
-        if len(models.keys()) != len(set(names)):
-            missing_models = set(names) - set(models.keys())
-            raise ValueError(
-                f"No model subclass found for the following class names or warehouse names: {', '.join(missing_models)}. Please ensure the entity schema model(s) are imported or defined."
-            )
-        return list(models.values())
+        name_set = frozenset(names)
+        cache_key = (cls, name_set)
+        if (cached_models := cls._subclasses_by_names_cache.get(cache_key)) is None:
+            models: dict[str, Type[BaseModel]] = {}  # noqa: UP006
+            for subclass in all_subclasses:
+                for name in (
+                    subclass.__name__,
+                    subclass.__schema_properties__.warehouse_name,
+                ):
+                    if name in name_set:
+                        models[name] = subclass
+            if len(models.keys()) != len(name_set):
+                missing_models = name_set - models.keys()
+                raise ValueError(
+                    f"No model subclass found for the following class names or warehouse names: {', '.join(missing_models)}. Please ensure the entity schema model(s) are imported or defined."
+                )
+            cached_models = list(models.values())
+            cls._subclasses_by_names_cache[cache_key] = cached_models
+        return list(cached_models)
 
     @classmethod
     def get_columns_dict(
@@ -203,22 +222,47 @@ class BaseModel(Generic[T], Base):
     ) -> dict[str, Column]:
         """Returns a dictionary of all benchling columns in the class. Benchling Column saves an instance of itself to the sqlalchemy Column info property.
         This function retrieves the info property and returns a dictionary of the columns.
+        Columns are fixed once the class is defined, so the result is cached per class and arguments.
         """
-        fields_to_exclude = []
-        if exclude_base_columns:
-            for base_model in cls.__bases__:
-                fields_to_exclude.extend(
-                    [
+        cache_key = (cls, exclude_base_columns, exclude_archived)
+        if (columns_dict := cls._columns_dict_cache.get(cache_key)) is None:
+            fields_to_exclude: set[str] = set()
+            if exclude_base_columns:
+                for base_model in cls.__bases__:
+                    fields_to_exclude.update(
                         c.name
                         for c in base_model.__dict__.values()
                         if isinstance(c, SqlColumn)
-                    ]
-                )
-            fields_to_exclude.append("creator_id$")
-        columns = [c for c in cls.__table__.columns if c.name not in fields_to_exclude]
-        if exclude_archived:
-            columns = [c for c in columns if not c.properties._archived]
-        return {c.name: c for c in columns}
+                    )
+                fields_to_exclude.add("creator_id$")
+            columns_dict = {
+                c.name: c
+                for c in cls.__table__.columns
+                if c.name not in fields_to_exclude
+                and not (exclude_archived and c.properties._archived)
+            }
+            cls._columns_dict_cache[cache_key] = columns_dict
+        return dict(columns_dict)
+
+    @classmethod
+    def content_hash(cls) -> str:
+        """Returns a hash of the schema properties, name template, and active fields of the model.
+        It matches get_schema_content_hash of a Benchling schema when the schema is in sync with the model.
+        The hash is cached per class, since models are fixed once they are defined.
+        """
+        if (content_hash := cls._content_hash_cache.get(cls)) is None:
+            content_hash = get_schema_content_hash(
+                cls.__schema_properties__,
+                cls.__name_template__,
+                {
+                    wh_name: column.properties
+                    for wh_name, column in cls.get_columns_dict(
+                        exclude_base_columns=True
+                    ).items()
+                },
+            )
+            cls._content_hash_cache[cls] = content_hash
+        return content_hash
 
     @classmethod
     def validate_model_definition(cls) -> bool:
@@ -234,20 +278,28 @@ class BaseModel(Generic[T], Base):
             LOGGER.warning(
                 f"{cls.__name__}: schema prefix '{cls.__schema_properties__.prefix}' is already used by another subclass. Please ensure fieldsets=True in BenchlingConnection you are updating/creating this schema."
             )
+        # The defined schema and dropdown names are only looked up once, and only if a field links to one.
+        schema_wh_names: set[str] | None = None
+        dropdown_names: set[str] | None = None
         for wh_name, field in properties.items():
             try:
                 if field.entity_link:
-                    if field.entity_link not in [
-                        s.__schema_properties__.warehouse_name
-                        for s in cls.__base__.get_all_subclasses()
-                    ]:
+                    if schema_wh_names is None:
+                        schema_wh_names = {
+                            s.__schema_properties__.warehouse_name
+                            for s in cls.__base__.get_all_subclasses()
+                        }
+                    if field.entity_link not in schema_wh_names:
                         raise ValueError(
                             f"Field {wh_name}: could not find entity link {field.entity_link} as a warehouse name for any currently defined schemas."
                         )
                 if field.dropdown_link:
-                    if field.dropdown_link not in [
-                        d.__benchling_name__ for d in BaseDropdown.get_all_subclasses()
-                    ]:
+                    if dropdown_names is None:
+                        dropdown_names = {
+                            d.__benchling_name__
+                            for d in BaseDropdown.get_all_subclasses()
+                        }
+                    if field.dropdown_link not in dropdown_names:
                         raise ValueError(
                             f"Field {wh_name}: could not find dropdown link {field.dropdown_link} as a name to any defined dropdowns."
                         )
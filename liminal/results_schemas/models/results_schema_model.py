@@ -3,10 +3,12 @@ from __future__ import annotations
 from functools import lru_cache
 from typing import Any
 
-import requests
 from pydantic import BaseModel
 
-from liminal.connection.benchling_service import BenchlingService
+from liminal.connection.benchling_service import (
+    INTERNAL_API_TIMEOUT,
+    BenchlingService,
+)
 from liminal.entity_schemas.tag_schema_models import TagSchemaFieldModel
 
 
@@ -47,12 +49,12 @@ class ResultsSchemaModel(BaseModel):
             A list of results schemas, in their raw JSON format.
         """
 
-        with requests.Session() as session:
-            response = session.get(
-                f"https://{benchling_service.benchling_tenant}.benchling.com/1/api/result-schemas",
-                headers=benchling_service.custom_post_headers,
-                cookies=benchling_service.custom_post_cookies,
-            )
+        response = benchling_service.http_session.get(
+            f"https://{benchling_service.benchling_tenant}.benchling.com/1/api/result-schemas",
+            headers=benchling_service.custom_post_headers,
+            cookies=benchling_service.custom_post_cookies,
+            timeout=INTERNAL_API_TIMEOUT,
+        )
         if not response.ok:
             raise Exception("Failed to get result schemas.")
         return response.json()["data"]
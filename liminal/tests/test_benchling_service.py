@@ -0,0 +1,72 @@
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+
+from liminal.connection.benchling_service import BenchlingService
+from liminal.entity_schemas.tag_schema_models import TagSchemaModel
+
+
+class _ServerErrorHandler(BaseHTTPRequestHandler):
+    num_requests = 0
+
+    def do_GET(self) -> None:
+        type(self).num_requests += 1
+        body = b'{"error": {"message": "Internal server error"}}'
+        self.send_response(500)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def server_error_url() -> Iterator[str]:
+    _ServerErrorHandler.num_requests = 0
+    server = HTTPServer(("127.0.0.1", 0), _ServerErrorHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class TestBenchlingService:
+    @patch("urllib3.util.retry.time.sleep")
+    def test_http_session_returns_last_server_error(
+        self, mock_sleep: Mock, server_error_url: str
+    ) -> None:
+        http_session = BenchlingService._create_http_session()
+        http_session.mount("http://", http_session.get_adapter("https://"))
+
+        response = http_session.get(server_error_url)
+
+        assert response.status_code == 500
+        assert response.json() == {"error": {"message": "Internal server error"}}
+        assert _ServerErrorHandler.num_requests == 4
+
+    @patch("urllib3.util.retry.time.sleep")
+    def test_caller_raises_its_error_after_server_errors(
+        self, mock_sleep: Mock, server_error_url: str
+    ) -> None:
+        http_session = BenchlingService._create_http_session()
+        http_session.mount("http://", http_session.get_adapter("https://"))
+        mock_benchling_service = Mock()
+        mock_benchling_service._tag_schemas_json = None
+        mock_benchling_service.custom_post_headers = {}
+        mock_benchling_service.custom_post_cookies = {}
+        mock_benchling_service.http_session.get.side_effect = (
+            lambda url, **kwargs: http_session.get(server_error_url, **kwargs)
+        )
+
+        with pytest.raises(Exception, match="Failed to get tag schemas."):
+            TagSchemaModel.get_all_json(mock_benchling_service)
+        assert _ServerErrorHandler.num_requests == 4
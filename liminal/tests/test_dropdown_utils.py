@@ -0,0 +1,194 @@
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+from benchling_sdk.models import DropdownSummary
+
+from liminal.dropdowns.utils import (
+    LIMINAL_CACHE_DIR_ENV_VAR,
+    LIMINAL_NO_CACHE_ENV_VAR,
+    _get_all_dropdowns_json,
+    dropdown_exists_in_benchling,
+    get_benchling_dropdown_id_name_map,
+    get_benchling_dropdown_summaries_by_names,
+    invalidate_benchling_dropdown_summaries,
+)
+
+
+class TestDropdownUtils:
+    def test_dropdown_exists_in_benchling(self) -> None:
+        mock_benchling_sdk = Mock()
+        mock_benchling_sdk.use_internal_api = False
+        mock_benchling_sdk._dropdown_summaries = None
+        mock_benchling_sdk._dropdown_summaries_by_name = None
+        mock_benchling_sdk.dropdowns.list.return_value = [
+            [DropdownSummary(id="sfs_1", name="Example Dropdown")],
+            [DropdownSummary(id="sfs_2", name="Other Dropdown")],
+        ]
+        assert dropdown_exists_in_benchling(mock_benchling_sdk, "Example Dropdown")
+        assert dropdown_exists_in_benchling(mock_benchling_sdk, "Other Dropdown")
+        assert not dropdown_exists_in_benchling(mock_benchling_sdk, "Missing Dropdown")
+        mock_benchling_sdk.dropdowns.list.assert_called_once()
+
+        invalidate_benchling_dropdown_summaries(mock_benchling_sdk)
+        assert dropdown_exists_in_benchling(mock_benchling_sdk, "Example Dropdown")
+        assert mock_benchling_sdk.dropdowns.list.call_count == 2
+
+    @patch("liminal.dropdowns.utils._get_all_dropdowns_json")
+    def test_get_benchling_dropdown_summaries_internal_api(
+        self, mock_get_all_dropdowns_json: Mock
+    ) -> None:
+        mock_benchling_sdk = Mock()
+        mock_benchling_sdk.use_internal_api = True
+        mock_benchling_sdk._dropdown_summaries = None
+        mock_benchling_sdk._dropdown_summaries_by_name = None
+        mock_get_all_dropdowns_json.return_value = [
+            {"id": "sfs_1", "name": "Example Dropdown", "archiveRecord": None},
+            {
+                "id": "sfs_2",
+                "name": "Archived Dropdown",
+                "archiveRecord": {"purpose": "Made in error"},
+            },
+        ]
+        assert get_benchling_dropdown_id_name_map(mock_benchling_sdk) == {
+            "sfs_1": "Example Dropdown"
+        }
+        assert dropdown_exists_in_benchling(mock_benchling_sdk, "Example Dropdown")
+        assert not dropdown_exists_in_benchling(mock_benchling_sdk, "Archived Dropdown")
+        mock_get_all_dropdowns_json.assert_called_once()
+        mock_benchling_sdk.dropdowns.list.assert_not_called()
+
+    def test_get_benchling_dropdown_summaries_by_names_fills_cache(self) -> None:
+        mock_benchling_sdk = Mock()
+        mock_benchling_sdk.use_internal_api = False
+        mock_benchling_sdk._dropdown_summaries = None
+        mock_benchling_sdk._dropdown_summaries_by_name = None
+        mock_benchling_sdk.dropdowns.list.side_effect = lambda: iter(
+            [
+                [DropdownSummary(id="sfs_1", name="Example Dropdown")],
+                [DropdownSummary(id="sfs_2", name="Other Dropdown")],
+            ]
+        )
+        # A name found on the first page stops the scan, so nothing is cached.
+        assert get_benchling_dropdown_summaries_by_names(
+            mock_benchling_sdk, {"Example Dropdown"}
+        ) == {"Example Dropdown": DropdownSummary(id="sfs_1", name="Example Dropdown")}
+        assert mock_benchling_sdk._dropdown_summaries is None
+
+        # A missing name scans every page, so the full listing is cached.
+        assert (
+            get_benchling_dropdown_summaries_by_names(
+                mock_benchling_sdk, {"Missing Dropdown"}
+            )
+            == {}
+        )
+        assert mock_benchling_sdk.dropdowns.list.call_count == 2
+        assert get_benchling_dropdown_summaries_by_names(
+            mock_benchling_sdk, {"Other Dropdown"}
+        ) == {"Other Dropdown": DropdownSummary(id="sfs_2", name="Other Dropdown")}
+        assert dropdown_exists_in_benchling(mock_benchling_sdk, "Example Dropdown")
+        assert mock_benchling_sdk.dropdowns.list.call_count == 2
+
+
+_DROPDOWNS_JSON: list[dict[str, Any]] = [
+    {
+        "id": "sfs_1",
+        "name": "Example Dropdown",
+        "archiveRecord": None,
+        "allSchemaFieldSelectorOptions": [],
+    }
+]
+
+
+def _mock_dropdowns_benchling_service(
+    status_code: int = 200, etag: str | None = '"etag_1"'
+) -> Mock:
+    mock_benchling_service = Mock()
+    mock_benchling_service.benchling_tenant = "tenant"
+    mock_benchling_service.registry_id = "reg_1"
+    mock_benchling_service.custom_post_headers = {}
+    mock_benchling_service.custom_post_cookies = {}
+    response = mock_benchling_service.http_session.get.return_value
+    response.status_code = status_code
+    response.headers = {"ETag": etag} if etag else {}
+    response.json.return_value = {"selectorsByRegistryId": {"reg_1": _DROPDOWNS_JSON}}
+    return mock_benchling_service
+
+
+class TestDropdownsCache:
+    @pytest.fixture
+    def cache_path(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        monkeypatch.setenv(LIMINAL_CACHE_DIR_ENV_VAR, str(tmp_path))
+        monkeypatch.delenv(LIMINAL_NO_CACHE_ENV_VAR, raising=False)
+        return tmp_path / "tenant" / "reg_1" / "dropdowns.json"
+
+    def _sent_headers(self, mock_benchling_service: Mock) -> dict[str, str]:
+        return mock_benchling_service.http_session.get.call_args.kwargs["headers"]
+
+    def test_writes_cache_with_etag(self, cache_path: Path) -> None:
+        mock_benchling_service = _mock_dropdowns_benchling_service()
+
+        assert _get_all_dropdowns_json(mock_benchling_service) == _DROPDOWNS_JSON
+        assert "If-None-Match" not in self._sent_headers(mock_benchling_service)
+        assert json.loads(cache_path.read_text()) == {
+            "etag": '"etag_1"',
+            "data": _DROPDOWNS_JSON,
+        }
+        assert list(cache_path.parent.iterdir()) == [cache_path]
+
+    def test_does_not_write_cache_without_etag(self, cache_path: Path) -> None:
+        mock_benchling_service = _mock_dropdowns_benchling_service(etag=None)
+
+        assert _get_all_dropdowns_json(mock_benchling_service) == _DROPDOWNS_JSON
+        assert not cache_path.exists()
+
+    def test_reuses_cache_when_not_modified(self, cache_path: Path) -> None:
+        cached_dropdowns = [{**_DROPDOWNS_JSON[0], "name": "Cached Dropdown"}]
+        cache_path.parent.mkdir(parents=True)
+        cache_path.write_text(
+            json.dumps({"etag": '"etag_0"', "data": cached_dropdowns})
+        )
+        mock_benchling_service = _mock_dropdowns_benchling_service(status_code=304)
+
+        assert _get_all_dropdowns_json(mock_benchling_service) == cached_dropdowns
+        assert self._sent_headers(mock_benchling_service)["If-None-Match"] == '"etag_0"'
+        mock_benchling_service.http_session.get.return_value.json.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "cache_contents",
+        ['{"etag": "\\"etag_0\\"", "da', '{"etag": "\\"etag_0\\""}', "[]"],
+    )
+    def test_invalid_cache_is_refetched(
+        self, cache_path: Path, cache_contents: str
+    ) -> None:
+        cache_path.parent.mkdir(parents=True)
+        cache_path.write_text(cache_contents)
+        mock_benchling_service = _mock_dropdowns_benchling_service()
+
+        assert _get_all_dropdowns_json(mock_benchling_service) == _DROPDOWNS_JSON
+        assert "If-None-Match" not in self._sent_headers(mock_benchling_service)
+        assert json.loads(cache_path.read_text())["etag"] == '"etag_1"'
+
+    @pytest.mark.parametrize("disable_with_env_var", [False, True])
+    def test_bypasses_cache(
+        self,
+        cache_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        disable_with_env_var: bool,
+    ) -> None:
+        cache_path.parent.mkdir(parents=True)
+        cache_path.write_text(json.dumps({"etag": '"etag_0"', "data": []}))
+        if disable_with_env_var:
+            monkeypatch.setenv(LIMINAL_NO_CACHE_ENV_VAR, "1")
+        mock_benchling_service = _mock_dropdowns_benchling_service()
+
+        assert (
+            _get_all_dropdowns_json(
+                mock_benchling_service, use_cache=disable_with_env_var
+            )
+            == _DROPDOWNS_JSON
+        )
+        assert "If-None-Match" not in self._sent_headers(mock_benchling_service)
+        assert json.loads(cache_path.read_text()) == {"etag": '"etag_0"', "data": []}
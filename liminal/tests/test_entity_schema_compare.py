@@ -15,6 +15,7 @@ from liminal.entity_schemas.operations import (
     UpdateEntitySchemaField,
     UpdateEntitySchemaNameTemplate,
 )
+from liminal.entity_schemas.utils import get_schema_content_hash
 from liminal.enums import BenchlingFieldType
 from liminal.orm.name_template import NameTemplate
 from liminal.orm.name_template_parts import TextPart
@@ -152,6 +153,12 @@ class TestCompareEntitySchemas:
             mock_get_benchling_entity_schemas.assert_called_once()
             mock_get_all_subclasses.assert_called_once()
             assert len(invalid_models["mock_entity"]) == 0
+            schema_props, name_template, fields = mock_benchling_schema[0]
+            assert mock_benchling_subclass[0].content_hash() == get_schema_content_hash(
+                schema_props,
+                name_template,
+                {k: v for k, v in fields.items() if v._archived is False},
+            )
 
             # Test when the Benchling schema is missing a field compared to the table model
             missing_field = copy.deepcopy(mock_benchling_schema)
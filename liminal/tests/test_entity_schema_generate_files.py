@@ -0,0 +1,86 @@
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+
+from liminal.entity_schemas.generate_files import generate_all_entity_schema_files
+
+
+def _generate(models: list[Any], write_path: Path, overwrite: bool) -> None:
+    with (
+        patch(
+            "liminal.entity_schemas.generate_files.get_converted_tag_schemas",
+            return_value=models,
+        ),
+        patch(
+            "liminal.entity_schemas.generate_files._get_dropdown_name_to_classname_map",
+            return_value={"Example Dropdown": "ExampleDropdown"},
+        ),
+    ):
+        generate_all_entity_schema_files(Mock(), write_path, overwrite)
+
+
+class TestGenerateEntitySchemaFiles:
+    def test_regenerate_unchanged_files(  # type: ignore[no-untyped-def]
+        self, mock_benchling_schema, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        _generate(mock_benchling_schema, tmp_path, overwrite=False)
+        schema_file = tmp_path / "entity_schemas" / "custom_entities" / "mock_entity.py"
+        assert schema_file.exists()
+        assert "1 entity schema files written" in capsys.readouterr().out
+        mtime = schema_file.stat().st_mtime_ns
+        content = schema_file.read_bytes()
+
+        _generate(mock_benchling_schema, tmp_path, overwrite=True)
+
+        assert "0 entity schema files written" in capsys.readouterr().out
+        assert schema_file.read_bytes() == content
+        assert schema_file.stat().st_mtime_ns == mtime
+        assert (tmp_path / "entity_schemas" / "__init__.py").exists()
+        assert (
+            tmp_path / "entity_schemas" / "custom_entities" / "__init__.py"
+        ).exists()
+
+    def test_overwrite_removes_stale_files(  # type: ignore[no-untyped-def]
+        self, mock_benchling_schema, tmp_path: Path
+    ) -> None:
+        write_path = tmp_path / "entity_schemas"
+        _generate(mock_benchling_schema, tmp_path, overwrite=False)
+        stale_file = write_path / "custom_entities" / "removed_entity.py"
+        stale_file.write_text("")
+        stale_directory = write_path / "dna_sequences"
+        stale_directory.mkdir()
+        (stale_directory / "old_sequence.py").write_text("")
+
+        _generate(mock_benchling_schema, tmp_path, overwrite=True)
+
+        assert not stale_file.exists()
+        assert not stale_directory.exists()
+        assert (write_path / "custom_entities" / "mock_entity.py").exists()
+
+    def test_overwrite_without_schemas_clears_directory(  # type: ignore[no-untyped-def]
+        self, mock_benchling_schema, tmp_path: Path
+    ) -> None:
+        write_path = tmp_path / "entity_schemas"
+        _generate(mock_benchling_schema, tmp_path, overwrite=False)
+
+        _generate([], tmp_path, overwrite=True)
+
+        assert write_path.exists()
+        assert list(write_path.iterdir()) == []
+
+    def test_no_overwrite_keeps_existing_files(  # type: ignore[no-untyped-def]
+        self, mock_benchling_schema, tmp_path: Path
+    ) -> None:
+        write_path = tmp_path / "entity_schemas"
+        _generate(mock_benchling_schema, tmp_path, overwrite=False)
+        schema_file = write_path / "custom_entities" / "mock_entity.py"
+        schema_file.write_text("# edited\n")
+        other_file = write_path / "custom_entities" / "other.py"
+        other_file.write_text("")
+
+        _generate(mock_benchling_schema, tmp_path, overwrite=False)
+
+        assert schema_file.read_text() == "# edited\n"
+        assert other_file.exists()
@@ -0,0 +1,171 @@
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+
+import liminal.external as b
+from liminal.base.properties.base_field_properties import BaseFieldProperties
+from liminal.entity_schemas.compare import _merged_field_props
+from liminal.entity_schemas.operations import (
+    CreateEntitySchemaField,
+    UpdateEntitySchemaField,
+)
+from liminal.entity_schemas.tag_schema_models import (
+    TagSchemaFieldModel,
+    TagSchemaModel,
+)
+from liminal.entity_schemas.utils import convert_tag_schema_field_to_field_properties
+from liminal.enums import BenchlingAPIFieldType, BenchlingFieldType
+
+
+def _tag_schema_field(
+    wh_field_name: str, archived: bool = False
+) -> TagSchemaFieldModel:
+    field_data: dict[str, Any] = {k: None for k in TagSchemaFieldModel.model_fields}
+    field_data.update(
+        fieldType=BenchlingAPIFieldType.STRING,
+        systemName=wh_field_name,
+        name=wh_field_name.title(),
+        isMulti=False,
+        isRequired=False,
+        isParentLink=False,
+        archiveRecord={"purpose": "Made in error"} if archived else None,
+    )
+    return TagSchemaFieldModel.model_validate(field_data)
+
+
+def _tag_schema(fields: list[TagSchemaFieldModel]) -> TagSchemaModel:
+    schema_data: dict[str, Any] = {
+        "id": "ts_1",
+        "sqlIdentifier": "schema",
+        "allFields": fields,
+        "fields": [f for f in fields if f.archiveRecord is None],
+    }
+    return TagSchemaModel.model_construct(**schema_data)
+
+
+def _text_field_props(wh_field_name: str) -> BaseFieldProperties:
+    return BaseFieldProperties(
+        name=wh_field_name.title(),
+        warehouse_name=wh_field_name,
+        type=BenchlingFieldType.TEXT,
+        required=False,
+        is_multi=False,
+        parent_link=False,
+    )
+
+
+class TestEntitySchemaOperations:
+    def test_update_field_revision_file_string_round_trip(self) -> None:
+        benchling_props = BaseFieldProperties(
+            name="Old Name",
+            warehouse_name="field",
+            type=BenchlingFieldType.TEXT,
+            required=False,
+            is_multi=False,
+        )
+        model_props = BaseFieldProperties(
+            name="New Name",
+            warehouse_name="field",
+            type=BenchlingFieldType.TEXT,
+            required=True,
+            is_multi=False,
+        )
+        op = UpdateEntitySchemaField(
+            "schema", "field", _merged_field_props(benchling_props, model_props)
+        )
+
+        op_str = op.revision_file_string()
+        assert op_str.startswith("b.UpdateEntitySchemaField('schema', 'field', ")
+
+        evaluated_op = eval(op_str, {"b": b})
+        assert isinstance(evaluated_op, UpdateEntitySchemaField)
+        assert evaluated_op.wh_schema_name == "schema"
+        assert evaluated_op.wh_field_name == "field"
+        assert evaluated_op.update_props.model_dump(exclude_unset=True) == {
+            "name": "New Name",
+            "required": True,
+        }
+
+    def test_create_fields_batch(self) -> None:
+        tag_schema = _tag_schema([_tag_schema_field("a"), _tag_schema_field("b")])
+        with (
+            patch(
+                "liminal.entity_schemas.operations.TagSchemaModel.get_one",
+                return_value=tag_schema,
+            ) as mock_get_one,
+            patch(
+                "liminal.entity_schemas.operations.update_tag_schema"
+            ) as mock_update_tag_schema,
+        ):
+            CreateEntitySchemaField.execute_batch(
+                [
+                    CreateEntitySchemaField("schema", _text_field_props("c"), 1),
+                    CreateEntitySchemaField("schema", _text_field_props("d"), 3),
+                ],
+                Mock(),
+            )
+
+            mock_get_one.assert_called_once()
+            mock_update_tag_schema.assert_called_once()
+            _, schema_id, payload = mock_update_tag_schema.call_args.args
+            assert schema_id == "ts_1"
+            assert [f["systemName"] for f in payload["fields"]] == [
+                "a",
+                "c",
+                "b",
+                "d",
+            ]
+
+    def test_create_fields_batch_failure_updates_nothing(self) -> None:
+        tag_schema = _tag_schema([_tag_schema_field("a")])
+        with (
+            patch(
+                "liminal.entity_schemas.operations.TagSchemaModel.get_one",
+                return_value=tag_schema,
+            ),
+            patch(
+                "liminal.entity_schemas.operations.update_tag_schema"
+            ) as mock_update_tag_schema,
+        ):
+            with pytest.raises(ValueError, match="already active"):
+                CreateEntitySchemaField.execute_batch(
+                    [
+                        CreateEntitySchemaField("schema", _text_field_props("b"), 1),
+                        CreateEntitySchemaField("schema", _text_field_props("a"), 0),
+                    ],
+                    Mock(),
+                )
+            mock_update_tag_schema.assert_not_called()
+
+    def test_create_field_unarchives_matching_archived_field(self) -> None:
+        archived_field = _tag_schema_field("b", archived=True)
+        tag_schema = _tag_schema([_tag_schema_field("a"), archived_field])
+        field_props = convert_tag_schema_field_to_field_properties(
+            archived_field, {}, {}
+        ).set_warehouse_name("b")
+        field_props._archived = False
+        with (
+            patch(
+                "liminal.entity_schemas.operations.TagSchemaModel.get_one",
+                return_value=tag_schema,
+            ),
+            patch(
+                "liminal.entity_schemas.operations.get_benchling_dropdown_id_name_map",
+                return_value={},
+            ),
+            patch(
+                "liminal.entity_schemas.operations.get_unit_id_to_name_map",
+                return_value={},
+            ),
+            patch(
+                "liminal.entity_schemas.operations.update_tag_schema"
+            ) as mock_update_tag_schema,
+        ):
+            CreateEntitySchemaField("schema", field_props, 0).execute(Mock())
+
+            mock_update_tag_schema.assert_called_once()
+            fields = mock_update_tag_schema.call_args.args[2]["fields"]
+            assert [f["systemName"] for f in fields] == ["b", "a"]
+            assert fields[0]["archiveRecord"] is None
+            assert "fieldType" in fields[0] and "id" in fields[0]
@@ -0,0 +1,33 @@
+from typing import Any
+from unittest.mock import Mock, patch
+
+from liminal.entity_schemas.utils import (
+    get_converted_tag_schemas,
+    invalidate_tag_schemas,
+)
+
+
+class TestEntitySchemaUtils:
+    def test_get_converted_tag_schemas_cached_on_service(  # type: ignore[no-untyped-def]
+        self, mock_benchling_schema
+    ) -> None:
+        mock_benchling_service = Mock()
+        mock_benchling_service._converted_tag_schemas = {}
+        with patch(
+            "liminal.entity_schemas.utils._get_converted_tag_schemas",
+            return_value=mock_benchling_schema,
+        ) as mock_convert:
+            first: list[Any] = get_converted_tag_schemas(mock_benchling_service)
+            first[0][0].set_warehouse_name("changed")
+            second = get_converted_tag_schemas(mock_benchling_service)
+
+            mock_convert.assert_called_once()
+            assert second[0][0].warehouse_name == "mock_entity"
+
+            get_converted_tag_schemas(mock_benchling_service, include_archived=True)
+            assert mock_convert.call_count == 2
+
+            invalidate_tag_schemas(mock_benchling_service)
+            assert mock_benchling_service._tag_schemas_json is None
+            get_converted_tag_schemas(mock_benchling_service)
+            assert mock_convert.call_count == 3
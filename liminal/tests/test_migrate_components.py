@@ -0,0 +1,93 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from liminal.base.properties.base_field_properties import BaseFieldProperties
+from liminal.entity_schemas.operations import (
+    ArchiveEntitySchemaField,
+    CreateEntitySchemaField,
+    EntitySchemaFieldOperation,
+    UpdateEntitySchema,
+)
+from liminal.enums import BenchlingFieldType
+from liminal.migrate.components import _batch_operations, execute_operations
+
+
+def _create_field(wh_schema_name: str, wh_field_name: str) -> CreateEntitySchemaField:
+    return CreateEntitySchemaField(
+        wh_schema_name,
+        BaseFieldProperties(
+            name=wh_field_name.title(),
+            warehouse_name=wh_field_name,
+            type=BenchlingFieldType.TEXT,
+        ),
+        0,
+    )
+
+
+class TestMigrateComponents:
+    def test_batch_operations(self) -> None:
+        create_a = _create_field("schema_one", "a")
+        create_b = _create_field("schema_one", "b")
+        create_c = _create_field("schema_two", "c")
+        archive_d = ArchiveEntitySchemaField("schema_two", "d")
+        archive_e = ArchiveEntitySchemaField("schema_two", "e")
+        update_schema = UpdateEntitySchema("schema_two", Mock())
+        create_f = _create_field("schema_two", "f")
+
+        batches = _batch_operations(
+            [
+                create_a,
+                create_b,
+                create_c,
+                archive_d,
+                archive_e,
+                update_schema,
+                create_f,
+            ]
+        )
+
+        assert batches == [
+            [create_a, create_b],
+            [create_c],
+            [archive_d, archive_e],
+            [update_schema],
+            [create_f],
+        ]
+
+    def test_execute_operations_batches_field_operations(self) -> None:
+        create_a = _create_field("schema", "a")
+        create_b = _create_field("schema", "b")
+        archive_c = ArchiveEntitySchemaField("schema", "c")
+        with (
+            patch.object(CreateEntitySchemaField, "validate"),
+            patch.object(
+                EntitySchemaFieldOperation, "execute_batch"
+            ) as mock_execute_batch,
+            patch.object(ArchiveEntitySchemaField, "execute") as mock_execute,
+        ):
+            assert execute_operations(Mock(), [create_a, create_b, archive_c])
+
+            mock_execute_batch.assert_called_once()
+            assert mock_execute_batch.call_args.args[0] == [create_a, create_b]
+            mock_execute.assert_called_once()
+
+    def test_execute_operations_stops_on_failed_batch(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        create_a = _create_field("schema", "a")
+        create_b = _create_field("schema", "b")
+        archive_c = ArchiveEntitySchemaField("schema", "c")
+        with (
+            patch.object(CreateEntitySchemaField, "validate"),
+            patch.object(
+                EntitySchemaFieldOperation,
+                "execute_batch",
+                side_effect=ValueError("Field a already exists."),
+            ),
+            patch.object(ArchiveEntitySchemaField, "execute") as mock_execute,
+        ):
+            assert not execute_operations(Mock(), [create_a, create_b, archive_c])
+
+            mock_execute.assert_not_called()
+            assert "Error at steps 1-2" in capsys.readouterr().out
@@ -3,10 +3,20 @@ import re
 import string
 from typing import Any
 
-import requests
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_fixed
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+from liminal.connection.benchling_service import (
+    INTERNAL_API_TIMEOUT,
+    BenchlingService,
+)
 
-from liminal.connection.benchling_service import BenchlingService
+_WORD_SEPARATOR_PATTERN = re.compile(r"[ /_\-]")
+_NON_ALPHANUMERIC_PATTERN = re.compile(r"[^a-zA-Z0-9]")
 
 
 def generate_random_id(length: int = 8) -> str:
@@ -18,18 +28,20 @@ def to_pascal_case(input_string: str) -> str:
     """
     Convert a string to PascalCase. Filters out any non-alphanumeric characters.
     """
-    words = re.split(r"[ /_\-]", input_string)
+    words = _WORD_SEPARATOR_PATTERN.split(input_string)
     # Then remove any non-alphanumeric characters and capitalize each word
-    return "".join(re.sub(r"[^a-zA-Z0-9]", "", word).capitalize() for word in words)
+    return "".join(
+        _NON_ALPHANUMERIC_PATTERN.sub("", word).capitalize() for word in words
+    )
 
 
 def to_snake_case(input_string: str) -> str:
     """
     Convert a string to snake_case. Filters out any non-alphanumeric characters.
     """
-    words = re.split(r"[ /_\-]", input_string)
+    words = _WORD_SEPARATOR_PATTERN.split(input_string)
     words = [word for word in words if word]
-    return "_".join(re.sub(r"[^a-zA-Z0-9]", "", word).lower() for word in words)
+    return "_".join(_NON_ALPHANUMERIC_PATTERN.sub("", word).lower() for word in words)
 
 
 def to_string_val(input_val: Any) -> str:
@@ -73,20 +85,20 @@ def is_valid_prefix(prefix: str) -> bool:
 
 
 @retry(
-    stop=stop_after_attempt(5),
+    stop=stop_after_attempt(8),
     retry=retry_if_exception_type(ValueError),
     reraise=True,
-    wait=wait_fixed(2),
+    wait=wait_exponential(multiplier=0.25, max=2),
 )
 def await_queued_response(
     status_url: str, benchling_sdk: BenchlingService
 ) -> dict[str, Any]:
-    with requests.Session() as session:
-        response = session.get(
-            f"https://{benchling_sdk.benchling_tenant}.benchling.com{status_url}",
-            headers=benchling_sdk.custom_post_headers,
-            cookies=benchling_sdk.custom_post_cookies,
-        )
+    response = benchling_sdk.http_session.get(
+        f"https://{benchling_sdk.benchling_tenant}.benchling.com{status_url}",
+        headers=benchling_sdk.custom_post_headers,
+        cookies=benchling_sdk.custom_post_cookies,
+        timeout=INTERNAL_API_TIMEOUT,
+    )
     response_json = response.json()
     if not response.ok:
         raise ValueError("Failed request: ", response_json)